@@ -5,6 +5,7 @@ based on YAML configuration, replacing the need for individual test classes.
 """
 
 import os
+import sys
 import yaml
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
@@ -228,7 +229,6 @@ class GlobalValidator(StandardSQLTest):
                 # Show progress if not in parallel mode
                 show_progress = not context.config.get('parallel_execution', False)
                 if show_progress:
-                    import sys
                     test_name = sub_test_config.get('name', f'sub_test_{i}')
                     sys.stdout.write(f"\r  Running {self.name} [{i+1}/{total_sub_tests}]: {test_name}")
                     sys.stdout.flush()
@@ -242,7 +242,6 @@ class GlobalValidator(StandardSQLTest):
             
             # Clear progress line
             if show_progress:
-                import sys
                 clear_line = " " * 120
                 sys.stdout.write(f"\r{clear_line}\r")
                 sys.stdout.flush()
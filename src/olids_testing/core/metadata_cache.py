@@ -0,0 +1,200 @@
+"""Schema metadata cache for OLIDS testing framework."""
+
+import threading
+import time
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from snowflake.snowpark import Session
+
+from olids_testing.core.sql_logger import log_sql_query
+
+
+class MetadataCache:
+    """Caches INFORMATION_SCHEMA column listings so tests in one run share a single lookup."""
+
+    def __init__(self, session: Session, database: str, ttl_seconds: float = 60.0):
+        """Initialize the cache.
+
+        Args:
+            session: Snowflake session used to load metadata
+            database: Database whose INFORMATION_SCHEMA is queried
+            ttl_seconds: Seconds before a cached schema listing is reloaded
+        """
+        self.session = session
+        self.database = database
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # schema -> (loaded at, table -> column names in ordinal order,
+        #            table -> nullable column names in ordinal order)
+        self._schemas: Dict[str, Tuple[float, Dict[str, List[str]], Dict[str, List[str]]]] = {}
+        # schema -> (loaded at, base table -> ROW_COUNT)
+        self._row_counts: Dict[str, Tuple[float, Dict[str, int]]] = {}
+        # (schema, table) -> (total rows, column -> (non-null count, completeness rate))
+        self._non_null_counts: Dict[Tuple[str, str], Tuple[int, Dict[str, Tuple[int, Optional[float]]]]] = {}
+
+    def get_columns(self, schemas: Iterable[str], nullable_only: bool = False) -> Dict[Tuple[str, str], List[str]]:
+        """Get the columns of every table in the given schemas.
+
+        Args:
+            schemas: Schema names to list
+            nullable_only: Only list columns not declared NOT NULL
+
+        Returns:
+            Dictionary of (schema, table) -> column names in ordinal order
+        """
+        schemas = list(dict.fromkeys(schemas))
+
+        with self._lock:
+            now = time.monotonic()
+            stale = [
+                schema for schema in schemas
+                if schema not in self._schemas or now - self._schemas[schema][0] > self.ttl_seconds
+            ]
+            if stale:
+                self._load_columns(stale, now)
+
+            listing = 2 if nullable_only else 1
+            return {
+                (schema, table): columns
+                for schema in schemas
+                for table, columns in self._schemas[schema][listing].items()
+            }
+
+    def get_tables(self, schema: str) -> List[str]:
+        """Get the table names in a schema.
+
+        Args:
+            schema: Schema name
+
+        Returns:
+            Table names in the schema
+        """
+        return [table for _, table in self.get_columns([schema])]
+
+    def get_row_counts(self, schemas: Iterable[str]) -> Dict[Tuple[str, str], int]:
+        """Get the metadata row count of every base table in the given schemas.
+
+        Args:
+            schemas: Schema names to list
+
+        Returns:
+            Dictionary of (schema, table) -> ROW_COUNT; views are not listed
+        """
+        schemas = list(dict.fromkeys(schemas))
+
+        with self._lock:
+            now = time.monotonic()
+            stale = [
+                schema for schema in schemas
+                if schema not in self._row_counts or now - self._row_counts[schema][0] > self.ttl_seconds
+            ]
+            if stale:
+                self._load_row_counts(stale, now)
+
+            return {
+                (schema, table): row_count
+                for schema in schemas
+                for table, row_count in self._row_counts[schema][1].items()
+            }
+
+    def get_non_null_counts(self, schema: str, table: str) -> Optional[Tuple[int, Dict[str, Tuple[int, Optional[float]]]]]:
+        """Get non-null counts already collected for a table by any test in this run.
+
+        Args:
+            schema: Schema name
+            table: Table name
+
+        Returns:
+            Tuple of (total rows, column -> (non-null count, completeness rate)), or None
+        """
+        with self._lock:
+            return self._non_null_counts.get((schema, table))
+
+    def store_non_null_counts(self, schema: str, table: str, total_rows: int,
+                              column_counts: Dict[str, Tuple[int, Optional[float]]]) -> None:
+        """Record non-null counts for a table so other tests can reuse the scan.
+
+        Args:
+            schema: Schema name
+            table: Table name
+            total_rows: Row count of the table
+            column_counts: Column -> (non-null count, completeness rate)
+        """
+        with self._lock:
+            _, known_counts = self._non_null_counts.get((schema, table), (total_rows, {}))
+            self._non_null_counts[(schema, table)] = (total_rows, {**known_counts, **column_counts})
+
+    def _load_columns(self, schemas: List[str], loaded_at: float) -> None:
+        """Load column listings for the given schemas with one query."""
+        # Schema names are bound rather than interpolated so the query text stays the same
+        # across runs and Snowflake can reuse its compiled plan
+        placeholders = ", ".join("?" for _ in schemas)
+        columns_query = f"""
+        SELECT table_schema, table_name, column_name, is_nullable
+        FROM "{self.database}".INFORMATION_SCHEMA.COLUMNS
+        WHERE table_schema IN ({placeholders})
+        ORDER BY table_schema, table_name, ordinal_position
+        """
+
+        log_sql_query(
+            columns_query,
+            "metadata_cache",
+            "get_schema_columns",
+            {"database": self.database, "schemas": schemas}
+        )
+
+        # Rows arrive one per column, sorted by table, so consecutive rows form each table's
+        # column list; rows are streamed rather than materializing the whole listing first
+        tables_by_schema: Dict[str, Dict[str, List[str]]] = {schema: {} for schema in schemas}
+        nullable_by_schema: Dict[str, Dict[str, List[str]]] = {schema: {} for schema in schemas}
+        rows = self.session.sql(columns_query, params=schemas).to_local_iterator()
+        # Rows are tuples in SELECT order, so fields are read positionally rather than by name
+        for (schema, table), table_rows in groupby(rows, key=itemgetter(0, 1)):
+            table_rows = list(table_rows)
+            tables_by_schema[schema][table] = [column for _, _, column, _ in table_rows]
+            nullable_by_schema[schema][table] = [
+                column for _, _, column, is_nullable in table_rows if is_nullable == 'YES'
+            ]
+
+        for schema, tables in tables_by_schema.items():
+            self._schemas[schema] = (loaded_at, tables, nullable_by_schema[schema])
+
+    def _load_row_counts(self, schemas: List[str], loaded_at: float) -> None:
+        """Load base table row counts for the given schemas with one SHOW TABLES per schema.
+
+        SHOW TABLES is answered by the metadata service without a running warehouse, unlike
+        INFORMATION_SCHEMA.TABLES. Temporary tables are excluded to match the 'BASE TABLE'
+        table type.
+        """
+        for schema in schemas:
+            tables_query = f'SHOW TABLES IN SCHEMA "{self.database}"."{schema}"'
+
+            log_sql_query(
+                tables_query,
+                "metadata_cache",
+                "get_schema_row_counts",
+                {"database": self.database, "schema": schema}
+            )
+
+            row_counts = {
+                row['name']: row['rows']
+                for row in self.session.sql(tables_query).to_local_iterator()
+                if row['kind'] != 'TEMPORARY'
+            }
+            self._row_counts[schema] = (loaded_at, row_counts)
+
+
+def get_metadata_cache(context) -> MetadataCache:
+    """Get the metadata cache for a test context, creating it on first use.
+
+    Args:
+        context: Test execution context
+
+    Returns:
+        Metadata cache for the context's source database
+    """
+    if context.metadata_cache is None:
+        context.metadata_cache = MetadataCache(context.session, context.databases["source"])
+    return context.metadata_cache
@@ -7,6 +7,7 @@ import signal
 import sys
 import threading
 import time
+import uuid
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
@@ -22,6 +23,7 @@ from rich.text import Text
 
 from .config import Config, EnvironmentConfig
 from .connection import SnowflakeConnection
+from .metadata_cache import MetadataCache
 from .test_base import BaseTest, TestContext, TestResult, TestStatus
 from .sql_logger import get_sql_logger
 
@@ -66,6 +68,7 @@ class ParallelTestRunner:
         self.completed_tests: set = set()  # Track completed individual tests
         self.lock = threading.Lock()
         self.start_time = None
+        self.metadata_cache: Optional[MetadataCache] = None  # Shared by all tests in a run
         
         # Spinner for active workers
         from rich.spinner import Spinner
@@ -330,7 +333,8 @@ class ParallelTestRunner:
                 },
                 session=shared_session,
                 config={},
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                metadata_cache=self.metadata_cache
             )
             
             # Run the test (suppress its own progress output in parallel mode)
@@ -368,7 +372,7 @@ class ParallelTestRunner:
                     base_test_name = item.test_name.split('_chunk_')[0] if '_chunk_' in item.test_name else item.test_name
                     if result.status == TestStatus.PASSED:
                         self.test_status[base_test_name] = "completed"
-                    elif result.status in [TestStatus.FAILED, TestStatus.ERROR]:
+                    elif result.failed:
                         self.test_status[base_test_name] = "failed"
                     else:
                         self.test_status[base_test_name] = "completed"  # Default to completed
@@ -527,6 +531,15 @@ class ParallelTestRunner:
         with SnowflakeConnection(self.env_config) as conn:
             shared_session = conn.get_session()
             
+            # Tag every query in this run once, rather than altering the session per test
+            try:
+                shared_session.query_tag = f"olids_suite:{uuid.uuid4().hex[:12]}"
+            except Exception:
+                pass  # Tagging is only for QUERY_HISTORY correlation
+            
+            # Share schema metadata lookups across every test in this run
+            self.metadata_cache = MetadataCache(shared_session, self.env_config.databases.source)
+            
             # Show initial state
             self.console.print("\n[bold cyan]Executing Tests[/bold cyan]")
             
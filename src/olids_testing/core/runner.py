@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import concurrent.futures
+import sys
 import time
 from typing import Dict, List, Optional, Set
 
@@ -43,11 +44,12 @@ class TestRunner:
     def _load_tests(self) -> None:
         """Load tests from test modules."""
         try:
-            from ..tests import TEST_REGISTRY, TEST_CATEGORIES
+            from ..tests import TEST_REGISTRY, TEST_CATEGORIES, get_test_class
             
             # Register all tests
-            for test_name, test_class in TEST_REGISTRY.items():
-                test_instance = test_class()
+            for test_name in TEST_REGISTRY:
+                test_class = get_test_class(test_name)
+                test_instance = test_class() if isinstance(test_class, type) else test_class
                 self.register_test(test_instance)
             
             # Register test suites by category
@@ -234,7 +236,6 @@ class TestRunner:
             )
             
             if show_progress:
-                import sys
                 print(f"Running {suite_name}")
                 print(f"Running {len(test_names)} tests")
                 for i, test_name in enumerate(test_names):
@@ -6,6 +6,21 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+# Set OLIDS_SQL_LOGGING to 0, false or no to turn query logging off
+_LOGGING_DISABLED_VALUES = {"0", "false", "no"}
+
+
+def sql_logging_enabled() -> bool:
+    """Check whether SQL query logging is turned on.
+    
+    Callers can check this before building large log-only queries so the string work is
+    skipped when nothing will be written.
+    
+    Returns:
+        False if the OLIDS_SQL_LOGGING environment variable disables logging, else True
+    """
+    return os.getenv("OLIDS_SQL_LOGGING", "1").strip().lower() not in _LOGGING_DISABLED_VALUES
+
 
 class SQLLogger:
     """Logs SQL queries executed during tests to files for debugging and analysis."""
@@ -139,7 +154,7 @@ def get_sql_logger() -> SQLLogger:
     return _global_logger
 
 
-def log_sql_query(query: str, test_name: str, description: str = "", metadata: Optional[dict] = None) -> Path:
+def log_sql_query(query: str, test_name: str, description: str = "", metadata: Optional[dict] = None) -> Optional[Path]:
     """Convenience function to log a SQL query using the global logger.
     
     Args:
@@ -149,8 +164,10 @@ def log_sql_query(query: str, test_name: str, description: str = "", metadata: O
         metadata: Optional metadata to include in the file header
         
     Returns:
-        Path to the created SQL file
+        Path to the created SQL file, or None if SQL logging is turned off
     """
+    if not sql_logging_enabled():
+        return None
     return get_sql_logger().log_query(query, test_name, description, metadata)
 
 
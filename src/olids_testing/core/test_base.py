@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
@@ -22,6 +22,13 @@ class TestStatus(Enum):
     SKIPPED = "skipped"
 
 
+# Statuses that count as a failed test
+_FAILED_STATUSES = frozenset({TestStatus.FAILED, TestStatus.ERROR})
+
+# PASS_FAIL_STATUS values emitted by the standard query builders
+_STATUS_MAP = {'PASS': TestStatus.PASSED, 'FAIL': TestStatus.FAILED}
+
+
 class TestSeverity(Enum):
     """Test failure severity levels."""
     LOW = "low"
@@ -61,7 +68,7 @@ class TestResult:
     @property
     def failed(self) -> bool:
         """Check if test failed."""
-        return self.status in [TestStatus.FAILED, TestStatus.ERROR]
+        return self.status in _FAILED_STATUSES
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary."""
@@ -90,6 +97,7 @@ class TestContext:
     session: Session
     config: Dict[str, Any]
     progress_callback: Optional[Callable[[int], None]] = None
+    metadata_cache: Optional[Any] = None  # MetadataCache shared by the tests in a run
     
     def get_full_table_name(self, database_key: str, schema_key: str, table_name: str) -> str:
         """Get fully qualified table name.
@@ -111,9 +119,17 @@ class TestContext:
         return f'"{database}"."{schema}"."{table_name}"'
 
 
+# Context attributes every test relies on; TestContext fields are fixed at import
+_REQUIRED_CONTEXT_FIELDS = frozenset({'session', 'databases', 'schemas'})
+_CONTEXT_FIELDS = frozenset(f.name for f in fields(TestContext))
+
+
 class BaseTest(ABC):
     """Base class for all OLIDS tests."""
     
+    # Whether a TestContext instance carries all required fields
+    _context_fields_valid = _REQUIRED_CONTEXT_FIELDS.issubset(_CONTEXT_FIELDS)
+    
     def __init__(self, name: str, description: str, category: str = "general"):
         """Initialize test.
         
@@ -191,8 +207,9 @@ class BaseTest(ABC):
         Returns:
             True if context is valid
         """
-        required_keys = ['session', 'databases', 'schemas']
-        return all(hasattr(context, key) for key in required_keys)
+        if isinstance(context, TestContext):
+            return self._context_fields_valid
+        return all(hasattr(context, key) for key in _REQUIRED_CONTEXT_FIELDS)
 
 
 class SQLTest(BaseTest):
@@ -319,6 +336,9 @@ class StandardSQLTest(BaseTest):
             if '{DATABASE}' in final_query:
                 final_query = final_query.replace('{DATABASE}', context.databases["source"])
             
+            # Label the query so it can be traced back to this test in QUERY_HISTORY
+            final_query = f"/* test_name={self.name} */\n" + final_query
+            
             # Execute the SQL query using the existing session from context
             df = context.session.sql(final_query).collect()
             
@@ -339,20 +359,11 @@ class StandardSQLTest(BaseTest):
             failed_records = getattr(row, 'FAILED_RECORDS', 0)
             pass_fail_status = getattr(row, 'PASS_FAIL_STATUS', 'FAIL')
             failure_threshold_used = getattr(row, 'FAILURE_THRESHOLD', threshold)
-            actual_failure_rate = getattr(row, 'ACTUAL_FAILURE_RATE', 0.0)
+            actual_failure_rate = getattr(row, 'ACTUAL_FAILURE_RATE', 0.0)  # Always computed in SQL
             failure_details = getattr(row, 'FAILURE_DETAILS', '')
             
-            # Convert pass/fail status to TestStatus
-            if pass_fail_status.upper() == 'PASS':
-                status = TestStatus.PASSED
-            elif pass_fail_status.upper() == 'FAIL':
-                status = TestStatus.FAILED
-            else:
-                status = TestStatus.ERROR
-            
-            # Calculate failure rate if not provided
-            if actual_failure_rate == 0.0 and total_tested > 0:
-                actual_failure_rate = (failed_records / total_tested) * 100.0
+            # Convert pass/fail status to TestStatus (builders emit uppercase literals)
+            status = _STATUS_MAP.get(pass_fail_status, TestStatus.ERROR)
             
             return TestResult(
                 test_name=self.name,
@@ -408,6 +419,7 @@ class StandardSQLTest(BaseTest):
             0.0 AS failure_threshold,
             CASE 
                 WHEN s.total_tested > 0 THEN (s.failed_records::FLOAT / s.total_tested::FLOAT * 100.0)
+                WHEN s.failed_records > 0 THEN 100.0
                 ELSE 0.0
             END AS actual_failure_rate,
             CASE 
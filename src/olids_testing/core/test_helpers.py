@@ -0,0 +1,59 @@
+"""Shared helpers for OLIDS test implementations."""
+
+import os
+from functools import lru_cache
+from typing import Any, Dict
+
+import yaml
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Minimum seconds between progress updates
+PROGRESS_INTERVAL = 0.1
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file once per (path, modification time)."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def load_yaml(path) -> Dict[str, Any]:
+    """Load a YAML file, reusing the parsed result until the file is modified.
+
+    The modification time is part of the cache key so an edited file is re-read.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content; the result is shared and must not be mutated
+    """
+    path = os.path.abspath(path)
+    return _parse_yaml(path, os.stat(path).st_mtime_ns)
+
+
+def query_workers(context, default: int) -> int:
+    """Get the number of concurrent queries a test may issue.
+
+    Args:
+        context: Test execution context
+        default: Worker count used when the config does not set query_workers
+
+    Returns:
+        Worker count; 1 when the runner is already executing tests in parallel on the shared
+        session, so tests do not nest their own fan-out inside the runner's
+    """
+    if context.config.get('parallel_execution', False):
+        return 1
+    return context.config.get('query_workers', default)
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a Snowflake identifier, escaping any embedded double quotes."""
+    return '"' + name.replace('"', '""') + '"'
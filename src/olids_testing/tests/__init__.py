@@ -1,83 +1,75 @@
 """Test modules for OLIDS testing framework."""
 
-from .data_quality import AllNullColumnsTest, EmptyTablesTest, ColumnCompletenessTest
-from .person_patterns import PersonPatternTest
-from .concept_mapping import ConceptMappingTest
-from .referential_integrity import ReferentialIntegrityTest
-from olids_testing.core.global_validator import create_global_validator_from_legacy_test
+import importlib
+from functools import lru_cache, partial
 
-# Main test registry - all tests now use consistent SQL output format
-# Using global validator for complex tests, keeping individual classes for simple ones
-TEST_REGISTRY = {
-    'null_columns': AllNullColumnsTest,
-    'empty_tables': EmptyTablesTest,
-    'column_completeness': ColumnCompletenessTest,
-    'referential_integrity': lambda: create_global_validator_from_legacy_test('referential_integrity'),
-    'person_patterns': lambda: create_global_validator_from_legacy_test('person_patterns'),
-    'concept_mapping': lambda: create_global_validator_from_legacy_test('concept_mapping'),
+from ._registry import TEST_SPECS, TEST_CATEGORY_NAMES
+from ._registry_api import make_api
+
+# Test classes are imported on first use (PEP 562) so listing tests does not
+# pull in Snowpark and every test module
+_LAZY_CLASSES = {
+    'AllNullColumnsTest': ('.data_quality', 'AllNullColumnsTest'),
+    'EmptyTablesTest': ('.data_quality', 'EmptyTablesTest'),
+    'ColumnCompletenessTest': ('.data_quality', 'ColumnCompletenessTest'),
+    'PersonPatternTest': ('.person_patterns', 'PersonPatternTest'),
+    'ConceptMappingTest': ('.concept_mapping', 'ConceptMappingTest'),
+    'ReferentialIntegrityTest': ('.referential_integrity', 'ReferentialIntegrityTest'),
 }
 
-# All tests registry (same as main registry)
-ALL_TESTS_REGISTRY = TEST_REGISTRY
 
-# Category mappings
-TEST_CATEGORIES = {
-    'data_quality': [
-        'null_columns',
-        'empty_tables',
-        'column_completeness',
-    ],
-    'referential_integrity': [
-        'referential_integrity',
-    ],
-    'person_validation': [
-        'person_patterns',
-    ],
-    'concept_mapping': [
-        'concept_mapping',
-    ],
-    'business_rules': [],
-}
+def __getattr__(name: str):
+    """Import test classes lazily on attribute access."""
+    if name not in _LAZY_CLASSES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY_CLASSES[name]
+    cls = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = cls
+    return cls
+
 
-def get_test_class(test_name: str):
-    """Get test class by name.
+@lru_cache(maxsize=None)
+def _global_validator(test_name: str):
+    """Build a global validator for a legacy test name, importing it on first use.
     
-    Args:
-        test_name: Name of the test
-        
-    Returns:
-        Test class or test instance
-        
-    Raises:
-        KeyError: If test name not found
+    Validators hold only their parsed configuration, so one instance per test
+    name is shared rather than re-reading the YAML files on every lookup.
     """
-    if test_name not in ALL_TESTS_REGISTRY:
-        raise KeyError(f"Test '{test_name}' not found. Available tests: {list(ALL_TESTS_REGISTRY.keys())}")
-    
-    test_class_or_factory = ALL_TESTS_REGISTRY[test_name]
-    
-    # If it's a lambda (factory function), call it to get the instance
-    if callable(test_class_or_factory) and hasattr(test_class_or_factory, '__name__') and test_class_or_factory.__name__ == '<lambda>':
-        return test_class_or_factory()
-    
-    # Otherwise, return the class
-    return test_class_or_factory
+    from olids_testing.core.global_validator import create_global_validator_from_legacy_test
+    return create_global_validator_from_legacy_test(test_name)
 
-def list_tests():
-    """Get list of main test names (for 'run all' command)."""
-    return list(TEST_REGISTRY.keys())
 
-def list_all_tests():
-    """Get list of all available test names (including individual tests)."""
-    return list(ALL_TESTS_REGISTRY.keys())
+# Main test registry - all tests now use consistent SQL output format
+# Using global validator for complex tests, keeping individual classes for simple ones
+# Class entries are resolvers returning the class, imported on first use;
+# global validator entries are factories returning a test instance
+TEST_REGISTRY = {}
 
-def list_tests_by_category(category: str):
-    """Get list of test names for a specific category.
-    
-    Args:
-        category: Category name
-        
-    Returns:
-        List of test names in the category
-    """
-    return TEST_CATEGORIES.get(category, [])
\ No newline at end of file
+# Category mappings
+TEST_CATEGORIES = {category: [] for category in TEST_CATEGORY_NAMES}
+
+for _test_name, _category, _class_name in TEST_SPECS:
+    if _class_name is None:
+        TEST_REGISTRY[_test_name] = partial(_global_validator, _test_name)
+    else:
+        TEST_REGISTRY[_test_name] = partial(__getattr__, _class_name)
+    TEST_CATEGORIES.setdefault(_category, []).append(_test_name)
+
+# All tests registry (same as main registry)
+ALL_TESTS_REGISTRY = TEST_REGISTRY
+
+get_test_class, list_tests, list_all_tests, list_tests_by_category = make_api(
+    TEST_REGISTRY, ALL_TESTS_REGISTRY, TEST_CATEGORIES
+)
+
+
+__all__ = [
+    *_LAZY_CLASSES,
+    'TEST_REGISTRY',
+    'ALL_TESTS_REGISTRY',
+    'TEST_CATEGORIES',
+    'get_test_class',
+    'list_tests',
+    'list_all_tests',
+    'list_tests_by_category',
+]
@@ -0,0 +1,21 @@
+"""Test registry specification for OLIDS testing framework."""
+
+# (test name, category, test class name) for every registered test.
+# A class name of None means the test is built by the global validator.
+TEST_SPECS = [
+    ('null_columns', 'data_quality', 'AllNullColumnsTest'),
+    ('empty_tables', 'data_quality', 'EmptyTablesTest'),
+    ('column_completeness', 'data_quality', 'ColumnCompletenessTest'),
+    ('referential_integrity', 'referential_integrity', None),
+    ('person_patterns', 'person_validation', None),
+    ('concept_mapping', 'concept_mapping', None),
+]
+
+# All test categories, in display order (some may have no tests yet)
+TEST_CATEGORY_NAMES = (
+    'data_quality',
+    'referential_integrity',
+    'person_validation',
+    'concept_mapping',
+    'business_rules',
+)
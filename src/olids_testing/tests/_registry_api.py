@@ -0,0 +1,63 @@
+"""Lookup functions over a test registry for OLIDS testing framework."""
+
+from typing import Any, Callable, Dict, List, Tuple
+
+# Sentinel for registry lookups, so a miss costs a single dict access
+_MISSING = object()
+
+
+def make_api(test_registry: Dict[str, Any], all_tests_registry: Dict[str, Any],
+             test_categories: Dict[str, List[str]]) -> Tuple[Callable, ...]:
+    """Build the registry lookup functions bound to the given registries.
+    
+    Args:
+        test_registry: Main test registry (test name -> class, class resolver or factory)
+        all_tests_registry: Registry of all available tests
+        test_categories: Category name -> list of test names
+        
+    Returns:
+        Tuple of (get_test_class, list_tests, list_all_tests, list_tests_by_category)
+    """
+    def get_test_class(test_name: str):
+        """Get test class by name.
+        
+        Args:
+            test_name: Name of the test
+            
+        Returns:
+            Test class, or test instance for tests built by a factory
+            
+        Raises:
+            KeyError: If test name not found
+        """
+        test_class_or_factory = all_tests_registry.get(test_name, _MISSING)
+        if test_class_or_factory is _MISSING:
+            raise KeyError(f"Test '{test_name}' not found. Available tests: {list(all_tests_registry.keys())}")
+        
+        # Classes are returned as-is; anything else is a lazy class resolver, which returns
+        # the class, or a factory, which returns the instance
+        if isinstance(test_class_or_factory, type):
+            return test_class_or_factory
+        
+        return test_class_or_factory()
+    
+    def list_tests():
+        """Get list of main test names (for 'run all' command)."""
+        return list(test_registry.keys())
+    
+    def list_all_tests():
+        """Get list of all available test names (including individual tests)."""
+        return list(all_tests_registry.keys())
+    
+    def list_tests_by_category(category: str):
+        """Get list of test names for a specific category.
+        
+        Args:
+            category: Category name
+            
+        Returns:
+            List of test names in the category
+        """
+        return test_categories.get(category, [])
+    
+    return get_test_class, list_tests, list_all_tests, list_tests_by_category
@@ -1,13 +1,77 @@
 """Concept mapping validation tests for OLIDS testing framework."""
 
-import os
-import yaml
+from functools import lru_cache
+from pathlib import Path
 import sys
-from typing import List, Dict, Any, Optional
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 from snowflake.snowpark import Session
 
 from olids_testing.core.test_base import StandardSQLTest, TestResult, TestStatus, TestContext
 from olids_testing.core.sql_logger import log_sql_query
+from olids_testing.core.metadata_cache import get_metadata_cache
+from olids_testing.core.test_helpers import PROGRESS_INTERVAL, load_yaml, query_workers
+
+# Default config lives in the project root config directory
+_DEFAULT_CONFIG_PATH = str(Path(__file__).resolve().parents[4] / 'config' / 'concept_mapping_tests.yml')
+
+# Concurrent Snowflake queries issued per test run (queries are I/O bound)
+_QUERY_WORKERS = 8
+
+# Failure detail line for one issue type: distinct IDs, issue label, records, percentage
+_format_issue = "{:,} concept IDs {} ({:,} records, {:.1f}%)".format
+
+# (distinct count key, record count key, label) for each breakdown issue type
+_MAPPING_ISSUE_KEYS = (
+    ('distinct_no_concept_map_match', 'no_concept_map_match', 'missing CONCEPT_MAP'),
+    ('distinct_no_concept_match', 'no_concept_match', 'missing CONCEPT'),
+    ('distinct_null_code', 'null_code', 'with NULL code'),
+)
+_QUALITY_ISSUE_KEYS = (
+    ('distinct_null_display', 'null_display', 'with NULL display'),
+)
+
+
+class _ConceptBreakdown(NamedTuple):
+    """Record and distinct concept ID counts per mapping issue type."""
+    no_concept_map_match: int
+    distinct_no_concept_map_match: int
+    no_concept_match: int
+    distinct_no_concept_match: int
+    null_display: int
+    distinct_null_display: int
+    null_code: int
+    distinct_null_code: int
+
+
+class _ConceptResult(NamedTuple):
+    """Outcome of a single source_table.concept_field mapping test."""
+    test_name: str
+    test_description: str
+    passed: bool
+    total_tested: int
+    failed_count: int
+    failure_message: Optional[str]
+    has_mapping_issue: bool = False
+    has_quality_issue: bool = False
+    breakdown: Optional[_ConceptBreakdown] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary shape used in TestResult metadata."""
+        result = {
+            'test_name': self.test_name,
+            'test_description': self.test_description,
+            'test_type': 'concept_mapping',
+            'passed': self.passed,
+            'total_tested': self.total_tested,
+            'failed_count': self.failed_count,
+            'failure_message': self.failure_message,
+        }
+        if self.breakdown is not None:
+            result['breakdown'] = self.breakdown._asdict()
+        return result
 
 
 class ConceptMappingTest(StandardSQLTest):
@@ -29,14 +93,7 @@ class ConceptMappingTest(StandardSQLTest):
             category="concept_mapping"
         )
         
-        # Default config path
-        if config_path is None:
-            # Assume config is in project root/config directory
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = os.path.join(current_dir, '..', '..', '..', '..')
-            config_path = os.path.join(project_root, 'config', 'concept_mapping_tests.yml')
-        
-        self.config_path = config_path
+        self.config_path = config_path or _DEFAULT_CONFIG_PATH
         self.mapping_config = self._load_mapping_config()
     
     def _build_query(self) -> str:
@@ -59,8 +116,7 @@ class ConceptMappingTest(StandardSQLTest):
     def _load_mapping_config(self) -> Dict[str, Any]:
         """Load concept mapping configuration from YAML file."""
         try:
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_yaml(self.config_path)
         except Exception as e:
             print(f"Warning: Could not load concept mapping config from {self.config_path}: {e}")
             return {}
@@ -86,7 +142,6 @@ class ConceptMappingTest(StandardSQLTest):
         session = context.session
         source_db = context.databases["source"]
         
-        all_test_results = []
         total_tests = 0
         failed_tests = 0
         
@@ -97,32 +152,56 @@ class ConceptMappingTest(StandardSQLTest):
         
         current_test = 0
         
-        # Check if we should show progress
-        show_progress = not context.config.get('parallel_execution', False)
+        # Check if we should show progress (the carriage-return line is only useful on a terminal)
+        show_progress = not context.config.get('parallel_execution', False) and sys.stdout.isatty()
+        last_progress = 0.0
+        
+        # Group tests by source table so each table is scanned with a single query
+        tests_by_table: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        for index, test_config in enumerate(tests):
+            source_table = test_config.get('source_table', 'unknown')
+            tests_by_table.setdefault(source_table, []).append((index, test_config))
         
         try:
-            # Execute each concept mapping test
-            for test_config in tests:
-                current_test += 1
-                
-                # Show progress only if not in parallel execution mode
-                source_table = test_config.get('source_table', 'unknown')
-                concept_field = test_config.get('concept_field', 'unknown')
-                test_name = f"{source_table}.{concept_field}"
-                
-                if show_progress:
-                    sys.stdout.write(f"\r  Running concept mapping tests [{current_test}/{total_tests}]: {test_name}")
-                    sys.stdout.flush()
-                
-                # Execute the concept mapping test
-                test_result = self._execute_concept_mapping_test(
-                    test_config, session, source_db
-                )
-                
-                all_test_results.append(test_result)
+            # Tables known to be empty pass trivially, without running the mapping joins.
+            # Row counts come from the run's shared metadata cache, so no extra lookup is issued
+            all_test_results = [None] * total_tests
+            row_counts = get_metadata_cache(context).get_row_counts(['OLIDS_MASKED'])
+            
+            # Execute the per-table queries concurrently on the shared session
+            max_workers = query_workers(context, _QUERY_WORKERS)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_table = {}
+                for source_table, table_tests in tests_by_table.items():
+                    if row_counts.get(('OLIDS_MASKED', source_table)) == 0:
+                        for index, test_config in table_tests:
+                            all_test_results[index] = self._empty_table_result(test_config)
+                        current_test += len(table_tests)
+                        continue
+                    
+                    future = executor.submit(
+                        self._execute_source_table_tests,
+                        source_table, [test_config for _, test_config in table_tests], session, source_db
+                    )
+                    future_to_table[future] = source_table
                 
-                if not test_result['passed']:
-                    failed_tests += 1
+                # Results are gathered on this thread, so the counters need no locking
+                for future in as_completed(future_to_table):
+                    source_table = future_to_table[future]
+                    table_tests = tests_by_table[source_table]
+                    current_test += len(table_tests)
+                    
+                    # Show progress only if not in parallel execution mode, throttled to limit terminal I/O
+                    now = time.monotonic()
+                    if show_progress and (now - last_progress >= PROGRESS_INTERVAL or current_test == total_tests):
+                        last_progress = now
+                        sys.stdout.write(f"\r  Running concept mapping tests [{current_test}/{total_tests}]: {source_table}")
+                        sys.stdout.flush()
+                    
+                    for (index, _), test_result in zip(table_tests, future.result()):
+                        all_test_results[index] = test_result
+                        if not test_result.passed:
+                            failed_tests += 1
             
             if show_progress:
                 # Clear progress line completely
@@ -131,85 +210,47 @@ class ConceptMappingTest(StandardSQLTest):
                 sys.stdout.write(f"\r{clear_line}\r")  # Clear the entire line
                 sys.stdout.flush()
             
-            # Build failure details with separated sections
+            # Build failure details with separated sections, formatting each failing
+            # result's mapping and data quality lines in a single pass
             failure_details = []
-            
-            # Separate mapping failures from data quality failures
-            mapping_failures = []
-            data_quality_failures = []
+            mapping_lines = []
+            quality_lines = []
             
             for result in all_test_results:
-                if not result['passed']:
-                    breakdown = result.get('breakdown', {})
-                    test_name = result['test_name']
-                    
-                    # Check if this has mapping issues (missing CONCEPT_MAP, CONCEPT entries, or NULL codes)
-                    has_mapping_issues = (breakdown.get('distinct_no_concept_map_match', 0) > 0 or 
-                                        breakdown.get('distinct_no_concept_match', 0) > 0 or
-                                        breakdown.get('distinct_null_code', 0) > 0)
-                    
-                    # Check if this has data quality issues (NULL display only)
-                    has_data_quality_issues = (breakdown.get('distinct_null_display', 0) > 0)
-                    
-                    # Add to mapping failures if it has mapping issues
-                    if has_mapping_issues:
-                        mapping_failures.append(result)
-                    
-                    # Add to data quality failures if it has data quality issues
-                    if has_data_quality_issues:
-                        data_quality_failures.append(result)
+                if result.passed:
+                    continue
+                
+                breakdown = result.breakdown
+                
+                # Percent per record, with the division-by-zero guard applied once
+                total_records = result.total_tested
+                percent_per_record = (100.0 / total_records) if total_records > 0 else 0.0
+                
+                # Mapping issues: missing CONCEPT_MAP, CONCEPT entries, or NULL codes
+                if result.has_mapping_issue:
+                    mapping_issues = self._format_issues(breakdown, _MAPPING_ISSUE_KEYS, percent_per_record)
+                    if mapping_issues:  # Only show if there are actual mapping issues
+                        mapping_lines.append(f"  • {result.test_name}: {', '.join(mapping_issues)}")
+                
+                # Data quality issues: NULL display only
+                if result.has_quality_issue:
+                    quality_issues = self._format_issues(breakdown, _QUALITY_ISSUE_KEYS, percent_per_record)
+                    quality_lines.append(f"  • {result.test_name}: {', '.join(quality_issues)}")
             
             if failed_tests > 0:
                 failure_details.append(f"Failed {failed_tests} out of {total_tests} concept mapping tests")
                 failure_details.append("")  # Empty line
                 
                 # Mapping failures section
-                if mapping_failures:
+                if mapping_lines:
                     failure_details.append("MAPPING FAILURES (missing CONCEPT_MAP, CONCEPT entries, or NULL codes):")
-                    for result in mapping_failures:
-                        breakdown = result.get('breakdown', {})
-                        mapping_issues = []
-                        
-                        total_records = result.get('total_tested', 1)  # Avoid division by zero
-                        
-                        # Only mapping issues in this section
-                        if breakdown.get('distinct_no_concept_map_match', 0) > 0:
-                            distinct_count = breakdown['distinct_no_concept_map_match']
-                            record_count = breakdown.get('no_concept_map_match', 0)
-                            percentage = (record_count / total_records * 100) if total_records > 0 else 0
-                            mapping_issues.append(f"{distinct_count:,} concept IDs missing CONCEPT_MAP ({record_count:,} records, {percentage:.1f}%)")
-                        if breakdown.get('distinct_no_concept_match', 0) > 0:
-                            distinct_count = breakdown['distinct_no_concept_match']
-                            record_count = breakdown.get('no_concept_match', 0)
-                            percentage = (record_count / total_records * 100) if total_records > 0 else 0
-                            mapping_issues.append(f"{distinct_count:,} concept IDs missing CONCEPT ({record_count:,} records, {percentage:.1f}%)")
-                        if breakdown.get('distinct_null_code', 0) > 0:
-                            distinct_count = breakdown['distinct_null_code']
-                            record_count = breakdown.get('null_code', 0)
-                            percentage = (record_count / total_records * 100) if total_records > 0 else 0
-                            mapping_issues.append(f"{distinct_count:,} concept IDs with NULL code ({record_count:,} records, {percentage:.1f}%)")
-                        
-                        if mapping_issues:  # Only show if there are actual mapping issues
-                            failure_details.append(f"  • {result['test_name']}: {', '.join(mapping_issues)}")
-                    
+                    failure_details.extend(mapping_lines)
                     failure_details.append("")  # Empty line between sections
                 
                 # Data quality failures section  
-                if data_quality_failures:
+                if quality_lines:
                     failure_details.append("DATA QUALITY FAILURES (NULL display values):")
-                    for result in data_quality_failures:
-                        breakdown = result.get('breakdown', {})
-                        quality_issues = []
-                        
-                        total_records = result.get('total_tested', 1)  # Avoid division by zero
-                        
-                        if breakdown.get('distinct_null_display', 0) > 0:
-                            distinct_count = breakdown['distinct_null_display']
-                            record_count = breakdown.get('null_display', 0)
-                            percentage = (record_count / total_records * 100) if total_records > 0 else 0
-                            quality_issues.append(f"{distinct_count:,} concept IDs with NULL display ({record_count:,} records, {percentage:.1f}%)")
-                        
-                        failure_details.append(f"  • {result['test_name']}: {', '.join(quality_issues)}")
+                    failure_details.extend(quality_lines)
             
             # Format as consistent output
             failure_rate = (failed_tests / total_tests * 100) if total_tests > 0 else 0.0
@@ -261,13 +302,12 @@ class ConceptMappingTest(StandardSQLTest):
                     'failure_threshold_used': 0.0,
                     'concept_mapping_tests_executed': total_tests,
                     'concept_mapping_tests_failed': failed_tests,
-                    'detailed_results': all_test_results,
+                    'detailed_results': [result.to_dict() for result in all_test_results],
                     'config_path': self.config_path
                 }
             )
             
         except Exception as e:
-            import traceback
             return TestResult(
                 test_name=self.name,
                 test_description=self.description,
@@ -280,27 +320,63 @@ class ConceptMappingTest(StandardSQLTest):
                 }
             )
     
-    def _execute_concept_mapping_test(self, test_config: Dict[str, Any], 
-                                    session: Session, source_db: str) -> Dict[str, Any]:
-        """Execute a single concept mapping test.
+    @staticmethod
+    def _empty_table_result(test_config: Dict[str, Any]) -> _ConceptResult:
+        """Build the passing result for a concept mapping test on an empty source table.
         
         Args:
             test_config: Test configuration from YAML
-            session: Snowflake session
-            source_db: Source database name
             
         Returns:
-            Dictionary with test results
+            Concept mapping test result with zero counts
         """
-        source_table = test_config['source_table']
-        concept_field = test_config['concept_field']
-        description = test_config.get('description', 'Concept mapping validation')
-        test_name = f"{source_table}.{concept_field}"
+        return _ConceptResult(
+            test_name=f"{test_config['source_table']}.{test_config['concept_field']}",
+            test_description=test_config.get('description', 'Concept mapping validation'),
+            passed=True,
+            total_tested=0,
+            failed_count=0,
+            failure_message=None,
+            breakdown=_ConceptBreakdown(0, 0, 0, 0, 0, 0, 0, 0)
+        )
+    
+    @staticmethod
+    def _format_issues(breakdown: _ConceptBreakdown, issue_keys: Tuple[Tuple[str, str, str], ...],
+                       percent_per_record: float) -> List[str]:
+        """Format the failure detail fragments for the issue types present in a breakdown.
         
-        try:
-            # Build the concept mapping validation query with distinct source ID counts
-            query = f"""
+        Args:
+            breakdown: Breakdown counts from a concept mapping result
+            issue_keys: (distinct count key, record count key, label) per issue type
+            percent_per_record: Percentage contributed by a single record
+            
+        Returns:
+            List of formatted issue fragments
+        """
+        issues = []
+        for distinct_key, record_key, label in issue_keys:
+            distinct_count = getattr(breakdown, distinct_key)
+            if distinct_count > 0:
+                record_count = getattr(breakdown, record_key)
+                issues.append(_format_issue(distinct_count, label, record_count, record_count * percent_per_record))
+        return issues
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _build_concept_field_query(source_table: str, concept_field: str, source_db: str) -> str:
+        """Build the mapping validation SELECT for one concept field (cached per shape).
+        
+        Args:
+            source_table: Source table name
+            concept_field: Concept ID column to validate
+            source_db: Source database name
+            
+        Returns:
+            SQL SELECT returning one row of counts labelled with the concept field
+        """
+        return f"""
             SELECT
+                '{concept_field}' as concept_field,
                 COUNT(*) as total_records_with_concept_ids,
                 COUNT(DISTINCT src."{concept_field}") as total_distinct_concept_ids,
                 COUNT(CASE 
@@ -332,81 +408,174 @@ class ConceptMappingTest(StandardSQLTest):
                 ON cm."target_code_id" = c."id"
             WHERE src."{concept_field}" IS NOT NULL
             """
+    
+    def _build_source_table_query(self, source_table: str, table_tests: List[Dict[str, Any]],
+                                  source_db: str) -> str:
+        """Build the query counting mapping issues for one or more concept fields of a table.
+        
+        Args:
+            source_table: Source table name shared by all tests
+            table_tests: Test configurations from YAML for this table
+            source_db: Source database name
+            
+        Returns:
+            Query returning one row per concept field, with the concept field first
+        """
+        # One SELECT per concept field, combined so the table needs a single round-trip
+        field_queries = "\n            UNION ALL\n".join(
+            self._build_concept_field_query(source_table, test_config['concept_field'], source_db)
+            for test_config in table_tests
+        )
+        
+        # Categorize mapping vs data quality issues in SQL alongside the counts
+        return f"""
+            SELECT
+                fq.*,
+                (fq.distinct_no_concept_map_match > 0
+                    OR fq.distinct_no_concept_match > 0
+                    OR fq.distinct_null_code > 0) as has_mapping_issue,
+                (fq.distinct_null_display > 0) as has_quality_issue
+            FROM (
+            {field_queries}
+            ) fq
+            """
+    
+    def _execute_source_table_tests(self, source_table: str, table_tests: List[Dict[str, Any]],
+                                    session: Session, source_db: str) -> List[_ConceptResult]:
+        """Execute all concept mapping tests for one source table in a single query.
+        
+        If the combined query fails, each concept field is tested on its own so the error is
+        reported only against the field that caused it.
+        
+        Args:
+            source_table: Source table name shared by all tests
+            table_tests: Test configurations from YAML for this table
+            session: Snowflake session
+            source_db: Source database name
+            
+        Returns:
+            List of test results, in the same order as table_tests
+        """
+        if len(table_tests) > 1:
+            try:
+                query = self._build_source_table_query(source_table, table_tests, source_db)
+                
+                log_sql_query(query, self.name, f"concept_mapping_{source_table}", {
+                    "source_table": source_table,
+                    "concept_fields": [test_config['concept_field'] for test_config in table_tests],
+                    "test_type": "concept_mapping"
+                })
+                
+                rows_by_field = {row[0]: row for row in session.sql(query).collect()}  # concept_field is the first column
+                
+                return [
+                    self._build_concept_mapping_result(test_config, rows_by_field[test_config['concept_field']])
+                    for test_config in table_tests
+                ]
+            except Exception:
+                pass  # Fall back to testing each concept field separately
+        
+        return [
+            self._execute_concept_field_test(source_table, test_config, session, source_db)
+            for test_config in table_tests
+        ]
+    
+    def _execute_concept_field_test(self, source_table: str, test_config: Dict[str, Any],
+                                    session: Session, source_db: str) -> _ConceptResult:
+        """Execute the concept mapping test for a single concept field.
+        
+        Args:
+            source_table: Source table name
+            test_config: Test configuration from YAML
+            session: Snowflake session
+            source_db: Source database name
+            
+        Returns:
+            Concept mapping test result
+        """
+        try:
+            concept_field = test_config['concept_field']
+            query = self._build_source_table_query(source_table, [test_config], source_db)
             
             log_sql_query(query, self.name, f"concept_mapping_{source_table}_{concept_field}", {
-                "source_table": source_table, 
-                "concept_field": concept_field,
+                "source_table": source_table,
+                "concept_fields": [concept_field],
                 "test_type": "concept_mapping"
             })
             
-            result = session.sql(query).collect()[0]
+            return self._build_concept_mapping_result(test_config, session.sql(query).first())
             
-            total_tested = result['TOTAL_RECORDS_WITH_CONCEPT_IDS']
-            total_distinct_concept_ids = result['TOTAL_DISTINCT_CONCEPT_IDS']
-            failed_mappings = result['FAILED_MAPPINGS']
-            failed_distinct_concept_ids = result['FAILED_DISTINCT_CONCEPT_IDS']
+        except Exception as e:
+            return _ConceptResult(
+                test_name=f"{source_table}.{test_config.get('concept_field', 'unknown')}",
+                test_description=test_config.get('description', 'Concept mapping validation'),
+                passed=False,
+                total_tested=0,
+                failed_count=0,
+                failure_message=f"Test execution error: {str(e)}"
+            )
+    
+    def _build_concept_mapping_result(self, test_config: Dict[str, Any], result: Any) -> _ConceptResult:
+        """Build the result for a single concept mapping test.
+        
+        Args:
+            test_config: Test configuration from YAML
+            result: Row of mapping counts for the test's concept field
+            
+        Returns:
+            Concept mapping test result
+        """
+        source_table = test_config['source_table']
+        concept_field = test_config['concept_field']
+        description = test_config.get('description', 'Concept mapping validation')
+        test_name = f"{source_table}.{concept_field}"
+        
+        # Columns follow the fixed order of _build_concept_field_query plus the two issue flags
+        (_, total_tested, total_distinct_concept_ids, failed_mappings, failed_distinct_concept_ids,
+         no_concept_map_match, distinct_no_concept_map_match,
+         no_concept_match, distinct_no_concept_match,
+         null_display, distinct_null_display,
+         null_code, distinct_null_code,
+         has_mapping_issue, has_quality_issue) = result
+        
+        # Build failure message with separated categories
+        failure_message = None
+        if failed_mappings > 0:
+            mapping_issues = []
+            data_quality_issues = []
             
-            no_concept_map_match = result['NO_CONCEPT_MAP_MATCH']
-            distinct_no_concept_map_match = result['DISTINCT_NO_CONCEPT_MAP_MATCH']
-            no_concept_match = result['NO_CONCEPT_MATCH']
-            distinct_no_concept_match = result['DISTINCT_NO_CONCEPT_MATCH']
-            null_display = result['NULL_DISPLAY']
-            distinct_null_display = result['DISTINCT_NULL_DISPLAY']
-            null_code = result['NULL_CODE']
-            distinct_null_code = result['DISTINCT_NULL_CODE']
+            # Categorize mapping vs data quality issues (using distinct counts for brevity)
+            if distinct_no_concept_map_match > 0:
+                mapping_issues.append(f"{distinct_no_concept_map_match:,} missing CONCEPT_MAP")
+            if distinct_no_concept_match > 0:
+                mapping_issues.append(f"{distinct_no_concept_match:,} missing CONCEPT") 
+            if distinct_null_display > 0:
+                data_quality_issues.append(f"{distinct_null_display:,} NULL display")
+            if distinct_null_code > 0:
+                mapping_issues.append(f"{distinct_null_code:,} NULL code")
             
-            # Build failure message with separated categories
-            failure_message = None
-            if failed_mappings > 0:
-                mapping_issues = []
-                data_quality_issues = []
-                
-                # Categorize mapping vs data quality issues (using distinct counts for brevity)
-                if distinct_no_concept_map_match > 0:
-                    mapping_issues.append(f"{distinct_no_concept_map_match:,} missing CONCEPT_MAP")
-                if distinct_no_concept_match > 0:
-                    mapping_issues.append(f"{distinct_no_concept_match:,} missing CONCEPT") 
-                if distinct_null_display > 0:
-                    data_quality_issues.append(f"{distinct_null_display:,} NULL display")
-                if distinct_null_code > 0:
-                    mapping_issues.append(f"{distinct_null_code:,} NULL code")
-                
-                # Build combined message
-                message_parts = []
-                if mapping_issues:
-                    message_parts.append(f"MAPPING ISSUES: {', '.join(mapping_issues)}")
-                if data_quality_issues:
-                    message_parts.append(f"DATA QUALITY: {', '.join(data_quality_issues)}")
-                
-                failure_message = f"Found {failed_distinct_concept_ids:,}/{total_distinct_concept_ids:,} failed concept IDs ({failed_mappings:,} records) - {' | '.join(message_parts)}"
+            # Build combined message
+            message_parts = []
+            if mapping_issues:
+                message_parts.append(f"MAPPING ISSUES: {', '.join(mapping_issues)}")
+            if data_quality_issues:
+                message_parts.append(f"DATA QUALITY: {', '.join(data_quality_issues)}")
             
-            return {
-                'test_name': test_name,
-                'test_description': description,
-                'test_type': 'concept_mapping',
-                'passed': failed_mappings == 0,
-                'total_tested': total_tested,
-                'failed_count': failed_mappings,
-                'failure_message': failure_message,
-                'breakdown': {
-                    'no_concept_map_match': no_concept_map_match,
-                    'distinct_no_concept_map_match': distinct_no_concept_map_match,
-                    'no_concept_match': no_concept_match,
-                    'distinct_no_concept_match': distinct_no_concept_match,
-                    'null_display': null_display,
-                    'distinct_null_display': distinct_null_display,
-                    'null_code': null_code,
-                    'distinct_null_code': distinct_null_code
-                }
-            }
-                
-        except Exception as e:
-            return {
-                'test_name': test_name,
-                'test_description': description,
-                'test_type': 'concept_mapping',
-                'passed': False,
-                'total_tested': 0,
-                'failed_count': 0,
-                'failure_message': f"Test execution error: {str(e)}"
-            }
\ No newline at end of file
+            failure_message = f"Found {failed_distinct_concept_ids:,}/{total_distinct_concept_ids:,} failed concept IDs ({failed_mappings:,} records) - {' | '.join(message_parts)}"
+        
+        return _ConceptResult(
+            test_name=test_name,
+            test_description=description,
+            passed=failed_mappings == 0,
+            total_tested=total_tested,
+            failed_count=failed_mappings,
+            failure_message=failure_message,
+            has_mapping_issue=has_mapping_issue,
+            has_quality_issue=has_quality_issue,
+            breakdown=_ConceptBreakdown(
+                no_concept_map_match, distinct_no_concept_map_match,
+                no_concept_match, distinct_no_concept_match,
+                null_display, distinct_null_display,
+                null_code, distinct_null_code
+            )
+        )
@@ -1,10 +1,218 @@
 """Data completeness checks for OLIDS testing framework."""
 
-from typing import List, Dict, Any, Optional
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from snowflake.snowpark import Session
 
 from olids_testing.core.test_base import StandardSQLTest, TestResult, TestStatus, TestContext
-from olids_testing.core.sql_logger import log_sql_query
+from olids_testing.core.sql_logger import log_sql_query, sql_logging_enabled
+from olids_testing.core.metadata_cache import MetadataCache, get_metadata_cache
+from olids_testing.core.test_helpers import PROGRESS_INTERVAL, query_workers, quote_identifier
+
+
+# Columns checked per UNION ALL query, keeping statements well under Snowflake's size limit
+_NULL_CHECK_BATCH_SIZE = 200
+
+# Concurrent Snowflake queries issued per test (queries are I/O bound)
+_QUERY_WORKERS = 16
+
+
+def _quote_literal(value: str) -> str:
+    """Quote a SQL string literal, escaping any embedded single quotes."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _qualified_table(source_db: str, schema_name: str, table_name: str) -> str:
+    """Build a fully qualified, quoted table name."""
+    return ".".join(quote_identifier(part) for part in (source_db, schema_name, table_name))
+
+
+def _run_concurrently(context: TestContext, worker: Callable[[Any], Any], items: List[Any],
+                      progress_units: Optional[Callable[[Any], int]] = None, progress_start: int = 0) -> List[Any]:
+    """Run a query worker over items on a thread pool, reporting progress as results arrive.
+    
+    Args:
+        context: Test execution context
+        worker: Callable applied to each item
+        items: Items to process
+        progress_units: Optional callable giving the progress units for a successful result;
+            when given, context.progress_callback receives the running total
+        progress_start: Units already processed before these items
+        
+    Returns:
+        One entry per item in item order: the worker's result, or the exception it raised
+    """
+    outcomes: List[Any] = [None] * len(items)
+    processed = progress_start
+    last_progress = 0.0
+    report_progress = progress_units is not None and context.progress_callback is not None
+    
+    # Never start more threads than there are items to process
+    workers = min(query_workers(context, _QUERY_WORKERS), len(items))
+    if workers:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_index = {executor.submit(worker, item): index for index, item in enumerate(items)}
+            
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                try:
+                    outcomes[index] = future.result()
+                except Exception as e:
+                    outcomes[index] = e
+                    continue
+            
+                # Report progress after each result, throttled to limit display updates
+                if report_progress:
+                    processed += progress_units(outcomes[index])
+                    now = time.monotonic()
+                    if now - last_progress >= PROGRESS_INTERVAL:
+                        last_progress = now
+                        context.progress_callback(processed)
+    
+    # Always report the final count
+    if report_progress:
+        context.progress_callback(processed)
+    return outcomes
+
+
+def _completeness_rate(non_null_count: int, total_rows: int) -> float:
+    """Get a completeness percentage rounded to 2dp; 0.0 for an empty table."""
+    return round(non_null_count / total_rows * 100, 2) if total_rows else 0.0
+
+
+def _multi_column_nonnull_counts(session: Session, source_db: str, schema_name: str, table_name: str,
+                                 columns: List[str], cache: Optional[MetadataCache] = None
+                                 ) -> Tuple[int, Dict[str, Tuple[int, Optional[float]]]]:
+    """Count non-null values for several columns of one table in a single scan.
+    
+    Args:
+        session: Snowflake session
+        source_db: Source database name
+        schema_name: Schema containing the table
+        table_name: Table to scan
+        columns: Column names to count
+        cache: Optional run-wide cache; counts found there are reused and new counts stored
+        
+    Returns:
+        Tuple of (total rows, column -> (non-null count, completeness rate rounded to 2dp))
+    """
+    if cache is not None:
+        cached = cache.get_non_null_counts(schema_name, table_name)
+        if cached is not None and all(column in cached[1] for column in columns):
+            return cached[0], {column: cached[1][column] for column in columns}
+    
+    # Only counts are computed in Snowflake; rates are derived client-side
+    column_aggregates = ",\n                ".join(
+        f'COUNT({quoted})' for quoted in map(quote_identifier, columns)
+    )
+    query = f'''
+            SELECT 
+                COUNT(*) as total_rows,
+                {column_aggregates}
+            FROM {_qualified_table(source_db, schema_name, table_name)}
+            '''
+    
+    # Aggregates are positional: total rows, then a non-null count per column
+    row = session.sql(query).first()
+    total_rows = row[0]
+    column_counts = {
+        column: (non_null_count, _completeness_rate(non_null_count, total_rows))
+        for column, non_null_count in zip(columns, row[1:])
+    }
+    
+    if cache is not None:
+        cache.store_non_null_counts(schema_name, table_name, total_rows, column_counts)
+    return total_rows, column_counts
+
+
+def _batched_nonnull_counts(context: TestContext, source_db: str, tables: Dict[Tuple[str, str], List[str]],
+                            cache: Optional[MetadataCache] = None) -> Dict[Tuple[str, str], Any]:
+    """Count non-null values for several tables in one UNION ALL round-trip.
+    
+    Each table is still scanned once; Snowflake schedules the branches of the single statement
+    together. If the combined query fails (e.g. one table is unreadable) each table is counted
+    on its own so the failure is reported against that table only.
+    
+    Args:
+        context: Test execution context
+        source_db: Source database name
+        tables: (schema, table) -> column names to count
+        cache: Optional run-wide cache in which new counts are stored
+        
+    Returns:
+        (schema, table) -> counts as returned by _multi_column_nonnull_counts, or the exception
+        raised while counting that table
+    """
+    session = context.session
+    
+    if len(tables) > 1:
+        branches = []
+        for (schema_name, table_name), columns in tables.items():
+            column_aggregates = ", ".join(f'COUNT({quoted})' for quoted in map(quote_identifier, columns))
+            branches.append(f'''
+            SELECT {_quote_literal(schema_name)} as schema_name, {_quote_literal(table_name)} as table_name,
+                   COUNT(*) as total_rows, ARRAY_CONSTRUCT({column_aggregates}) as column_counts
+            FROM {_qualified_table(source_db, schema_name, table_name)}''')
+        query = "\n            UNION ALL\n".join(branches)
+        
+        try:
+            results = {}
+            for schema_name, table_name, total_rows, column_counts in session.sql(query).collect():
+                # ARRAY values arrive as JSON text holding a non-null count per column
+                values = json.loads(column_counts)
+                columns = tables[(schema_name, table_name)]
+                counts = {
+                    column: (non_null_count, _completeness_rate(non_null_count, total_rows))
+                    for column, non_null_count in zip(columns, values)
+                }
+                if cache is not None:
+                    cache.store_non_null_counts(schema_name, table_name, total_rows, counts)
+                results[(schema_name, table_name)] = (total_rows, counts)
+            return results
+        except Exception:
+            pass  # Fall back to counting each table separately
+    
+    def count_table(table_key: Tuple[str, str]) -> Tuple[int, Dict[str, Tuple[int, Optional[float]]]]:
+        schema_name, table_name = table_key
+        return _multi_column_nonnull_counts(session, source_db, schema_name, table_name, tables[table_key], cache)
+    
+    table_keys = list(tables)
+    return dict(zip(table_keys, _run_concurrently(context, count_table, table_keys)))
+
+
+def _fully_complete_counts(session: Session, source_db: str, schema_name: str, table_name: str,
+                           columns: List[str]) -> Optional[Tuple[int, Dict[str, Tuple[int, Optional[float]]]]]:
+    """Check whether several columns of one table have no NULLs, stopping at the first NULL found.
+    
+    Args:
+        session: Snowflake session
+        source_db: Source database name
+        schema_name: Schema containing the table
+        table_name: Table to scan
+        columns: Column names to check
+        
+    Returns:
+        Counts in the form returned by _multi_column_nonnull_counts when the table has rows and
+        every column is fully populated, otherwise None
+    """
+    table = _qualified_table(source_db, schema_name, table_name)
+    null_conditions = " OR ".join(f'{quote_identifier(column)} IS NULL' for column in columns)
+    query = f'''
+            SELECT 
+                (SELECT COUNT(*) FROM {table}) as total_rows,
+                (SELECT COUNT(*) FROM (
+                    SELECT 1 FROM {table}
+                    WHERE {null_conditions} LIMIT 1
+                )) as has_nulls
+            '''
+    
+    total_rows, has_nulls = session.sql(query).first()
+    if has_nulls or not total_rows:
+        return None
+    return total_rows, {column: (total_rows, 100.0) for column in columns}
 
 
 class AllNullColumnsTest(StandardSQLTest):
@@ -19,7 +227,7 @@ class AllNullColumnsTest(StandardSQLTest):
         self.schemas = schemas or ["OLIDS_MASKED", "OLIDS_TERMINOLOGY"]
         
         # Build the SQL query
-        sql_query = self._build_null_columns_query()
+        sql_query = self._build_null_columns_query(tuple(self.schemas))
         
         super().__init__(
             name="null_columns",
@@ -28,9 +236,11 @@ class AllNullColumnsTest(StandardSQLTest):
             category="data_quality"
         )
     
-    def _build_null_columns_query(self) -> str:
-        """Build the SQL query for null columns detection."""
-        schema_list = "', '".join(self.schemas)
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _build_null_columns_query(schemas: Tuple[str, ...]) -> str:
+        """Build the SQL query for null columns detection (cached per schema list)."""
+        schema_list = "', '".join(schemas)
         
         return f"""
         WITH all_tables_columns AS (
@@ -70,143 +280,189 @@ class AllNullColumnsTest(StandardSQLTest):
         FROM null_column_analysis nca
         """
     
+    @staticmethod
+    def _build_non_null_batch_query(source_db: str, schema_name: str, batch: List[Tuple[str, str]]) -> str:
+        """Build a query returning one has-value flag row per (table, column) in a batch.
+        
+        Args:
+            source_db: Source database name
+            schema_name: Schema containing the tables
+            batch: (table name, column name) pairs to check
+            
+        Returns:
+            UNION ALL query with TABLE_NAME, COLUMN_NAME and HAS_VALUE columns. HAS_VALUE is
+            TRUE if any value is non-NULL, FALSE if every row is NULL and NULL if the table is empty.
+        """
+        # Each probe stops at the first matching row, so populated columns (the common case)
+        # are settled without scanning the whole table; only all-NULL columns are read in full
+        return "\n            UNION ALL\n".join(
+            f'''
+            SELECT {_quote_literal(table_name)} as table_name, {_quote_literal(column_name)} as column_name,
+                   CASE
+                       WHEN (SELECT COUNT(*) FROM (
+                           SELECT 1 FROM {_qualified_table(source_db, schema_name, table_name)}
+                           WHERE {quote_identifier(column_name)} IS NOT NULL LIMIT 1
+                       )) > 0 THEN TRUE
+                       WHEN (SELECT COUNT(*) FROM (
+                           SELECT 1 FROM {_qualified_table(source_db, schema_name, table_name)} LIMIT 1
+                       )) > 0 THEN FALSE
+                   END as has_value'''
+            for table_name, column_name in batch
+        )
+    
     def execute(self, context: TestContext) -> TestResult:
         """Execute the null columns test using existing Python logic with consistent output."""
         session = context.session
         source_db = context.databases["source"]
         
         try:
-            # Get all tables and their columns grouped by table
-            schema_list = "', '".join(self.schemas)
-            tables_query = f"""
-            SELECT table_schema, table_name, 
-                   LISTAGG(column_name, ',') WITHIN GROUP (ORDER BY ordinal_position) as columns
-            FROM "{source_db}".INFORMATION_SCHEMA.COLUMNS 
-            WHERE table_schema IN ('{schema_list}')
-            GROUP BY table_schema, table_name
-            ORDER BY table_schema, table_name
-            """
-            
-            # Log the schema tables query
-            log_sql_query(
-                tables_query,
-                self.name,
-                "get_tables_with_columns",
-                {"database": source_db, "schemas": self.schemas}
-            )
-            
-            tables = session.sql(tables_query).collect()
+            # Get all tables and their columns from the run's shared metadata cache
+            metadata_cache = get_metadata_cache(context)
+            table_columns = metadata_cache.get_columns(self.schemas)
+            nullable_columns = metadata_cache.get_columns(self.schemas, nullable_only=True)
+            row_counts = metadata_cache.get_row_counts(self.schemas)
             
-            all_null_columns = []
             total_checked = 0
             columns_processed = 0
+            known_null_columns = []
             
-            # Pre-count all columns to ensure we have a reliable total
-            for row in tables:
-                columns_list = row['COLUMNS'].split(',') if row['COLUMNS'] else []
-                valid_columns = [col.strip() for col in columns_list if col.strip()]
-                total_checked += len(valid_columns)
-            
-            for row in tables:
-                schema_name = row['TABLE_SCHEMA']
-                table_name = row['TABLE_NAME']
-                columns_list = row['COLUMNS'].split(',') if row['COLUMNS'] else []
+            # Flatten to one (table, column) pair per column, grouped by schema. NOT NULL
+            # columns, and every column of a table whose metadata row count is zero, can't be
+            # all-NULL, so they count as checked without being scanned. Columns already counted
+            # by another test in this run (e.g. column completeness) are answered from those
+            # counts instead of being scanned again
+            columns_by_schema: Dict[str, List[Tuple[str, str]]] = {}
+            for (schema_name, table_name), all_columns in table_columns.items():
+                total_checked += len(all_columns)
+                if row_counts.get((schema_name, table_name)) == 0:
+                    columns_processed += len(all_columns)
+                    continue
+                columns = nullable_columns[(schema_name, table_name)]
+                columns_processed += len(all_columns) - len(columns)
                 
-                # Skip tables with no columns or empty column list
-                if not columns_list or not row['COLUMNS']:
+                cached = metadata_cache.get_non_null_counts(schema_name, table_name)
+                if cached is not None:
+                    total_rows, column_counts = cached
+                    for col in columns:
+                        if col in column_counts and column_counts[col][0] == 0 and total_rows > 0:
+                            known_null_columns.append(f"{schema_name}.{table_name}.{col}")
+                    columns_processed += sum(1 for col in columns if col in column_counts)
+                    columns = [col for col in columns if col not in column_counts]
+                
+                schema_columns = columns_by_schema.setdefault(schema_name, [])
+                schema_columns.extend((table_name, col) for col in columns)
+            
+            # Check columns with one UNION ALL query per batch instead of one query per table
+            batches = [
+                (schema_name, schema_columns[start:start + _NULL_CHECK_BATCH_SIZE])
+                for schema_name, schema_columns in columns_by_schema.items()
+                for start in range(0, len(schema_columns), _NULL_CHECK_BATCH_SIZE)
+            ]
+            
+            def check_batch(schema_batch: Tuple[str, List[Tuple[str, str]]]) -> Tuple[int, List[Any]]:
+                schema_name, batch = schema_batch
+                # Filter in Snowflake so only all-NULL columns come back: FALSE (not NULL, which
+                # means an empty table) means every row is NULL
+                check_query = f"""
+            SELECT table_name, column_name
+            FROM ({self._build_non_null_batch_query(source_db, schema_name, batch)}
+            )
+            WHERE has_value = FALSE"""
+                return len(batch), session.sql(check_query).collect()
+            
+            batch_results = _run_concurrently(
+                context, check_batch, batches,
+                progress_units=lambda result: result[0], progress_start=columns_processed
+            )
+            
+            all_null_columns = list(known_null_columns)
+            retry_tables: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+            for (schema_name, batch), results in zip(batches, batch_results):
+                if isinstance(results, Exception):
+                    # Re-check a failed batch one table at a time so only the table that
+                    # caused the failure goes unchecked
+                    for table_name, column_name in batch:
+                        retry_tables.setdefault((schema_name, table_name), []).append((table_name, column_name))
                     continue
                 
-                try:
-                    # Build a single query to check all columns in the table at once
-                    column_checks = []
-                    for col in columns_list:
-                        col = col.strip()
-                        if col:  # Make sure column name is not empty
-                            column_checks.append(f'COUNT("{col}") as "{col}_non_null"')
-                    
-                    # Skip if no valid columns found
-                    if not column_checks:
+                # Rows are (table_name, column_name) in query order
+                columns_processed += results[0]
+                all_null_columns.extend(
+                    f"{schema_name}.{table_name}.{column_name}" for table_name, column_name in results[1]
+                )
+            
+            unchecked_tables = []
+            unchecked_columns = 0
+            if retry_tables:
+                table_keys = list(retry_tables)
+                table_results = _run_concurrently(
+                    context, lambda table_key: check_batch((table_key[0], retry_tables[table_key])), table_keys,
+                    progress_units=lambda result: result[0], progress_start=columns_processed
+                )
+                for (schema_name, table_name), results in zip(table_keys, table_results):
+                    if isinstance(results, Exception):
+                        unchecked_tables.append(f"{schema_name}.{table_name}")
+                        unchecked_columns += len(retry_tables[(schema_name, table_name)])
                         continue
-                    
-                    check_query = f'''
-                    SELECT 
-                        COUNT(*) as total_rows,
-                        {', '.join(column_checks)}
-                    FROM "{source_db}"."{schema_name}"."{table_name}"
-                    '''
-                    
-                    result = session.sql(check_query).collect()[0]
-                    total_rows = result['TOTAL_ROWS']
-                    
-                    # Check each column's null count
-                    for col in columns_list:
-                        col = col.strip()
-                        if not col:  # Skip empty column names
-                            continue
-                        
-                        try:
-                            # Column names in result are uppercase
-                            result_key = f'{col.upper()}_NON_NULL'
-                            non_null_count = result[result_key]
-                            
-                            # If no non-null values and table has rows, it's all NULL
-                            if non_null_count == 0 and total_rows > 0:
-                                all_null_columns.append(f"{schema_name}.{table_name}.{col}")
-                        except KeyError:
-                            # Skip columns that can't be checked
-                            continue
-                        
-                        # Update progress counter
-                        columns_processed += 1
-                        
-                    # Report progress after processing this table
-                    if context.progress_callback:
-                        context.progress_callback(columns_processed)
-                        
-                except Exception as e:
-                    # Log the error but continue with other tables
-                    continue
+                    all_null_columns.extend(
+                        f"{schema_name}.{table_name}.{column_name}" for _, column_name in results[1]
+                    )
             
             # Format as standardized output
             failed_records = len(all_null_columns)
             failure_rate = (failed_records / total_checked * 100) if total_checked > 0 else 0.0
             
-            if failed_records == 0:
+            failure_details_list = []
+            if failed_records == 0 and not unchecked_tables:
                 status = TestStatus.PASSED
                 pass_fail_status = "PASS"
-                failure_details = "No columns contain only NULL values"
+                failure_details_list.append("No columns contain only NULL values")
+            elif failed_records == 0:
+                # An incomplete check is never reported as a clean pass
+                status = TestStatus.ERROR
+                pass_fail_status = "ERROR"
             else:
                 status = TestStatus.FAILED
                 pass_fail_status = "FAIL"
                 
-                failure_details_list = [f"Found {failed_records} columns with 100% NULL values:"]
+                failure_details_list.append(f"Found {failed_records} columns with 100% NULL values:")
                 for col in all_null_columns[:10]:  # Show first 10
                     failure_details_list.append(f"  • {col}")
                 if len(all_null_columns) > 10:
                     failure_details_list.append(f"  ... and {len(all_null_columns) - 10} more")
-                
-                failure_details = "\n".join(failure_details_list)
             
-            # Log the equivalent query for procedure deployment
-            equivalent_query = f"""
-            -- Output equivalent (would require dynamic SQL generation for all columns)
-            SELECT 
-                'null_columns' AS test_name,
-                'Identifies columns that contain only NULL values' AS test_description,
-                {total_checked} AS total_tested,
-                {failed_records} AS failed_records,
-                '{pass_fail_status}' AS pass_fail_status,
-                0.0 AS failure_threshold,
-                {failure_rate} AS actual_failure_rate,
-                '{failure_details.replace("'", "''")}' AS failure_details,
-                CURRENT_TIMESTAMP() AS execution_timestamp
-            """
-            log_sql_query(
-                equivalent_query,
-                self.name,
-                "output_equivalent",
-                {"null_columns": all_null_columns, "test_type": "python_with_sql_output"}
-            )
+            if unchecked_tables:
+                failure_details_list.append(
+                    f"Could not check {unchecked_columns} columns in {len(unchecked_tables)} tables:"
+                )
+                for table in unchecked_tables[:10]:  # Show first 10
+                    failure_details_list.append(f"  • {table}")
+                if len(unchecked_tables) > 10:
+                    failure_details_list.append(f"  ... and {len(unchecked_tables) - 10} more")
+            
+            failure_details = "\n".join(failure_details_list)
+            
+            # Log the equivalent query for procedure deployment, building it only if it will be written
+            if sql_logging_enabled():
+                equivalent_query = f"""
+                -- Output equivalent (would require dynamic SQL generation for all columns)
+                SELECT 
+                    'null_columns' AS test_name,
+                    'Identifies columns that contain only NULL values' AS test_description,
+                    {total_checked} AS total_tested,
+                    {failed_records} AS failed_records,
+                    '{pass_fail_status}' AS pass_fail_status,
+                    0.0 AS failure_threshold,
+                    {failure_rate} AS actual_failure_rate,
+                    '{failure_details.replace("'", "''")}' AS failure_details,
+                    CURRENT_TIMESTAMP() AS execution_timestamp
+                """
+                log_sql_query(
+                    equivalent_query,
+                    self.name,
+                    "output_equivalent",
+                    {"null_columns": all_null_columns, "test_type": "python_with_sql_output"}
+                )
             
             return TestResult(
                 test_name=self.name,
@@ -218,7 +474,9 @@ class AllNullColumnsTest(StandardSQLTest):
                 failure_details=failure_details,
                 metadata={
                     'failure_threshold_used': 0.0,
-                    'null_columns': all_null_columns
+                    'null_columns': all_null_columns,
+                    'unchecked_columns': unchecked_columns,
+                    'unchecked_tables': unchecked_tables
                 }
             )
             
@@ -243,7 +501,7 @@ class EmptyTablesTest(StandardSQLTest):
         self.schemas = schemas or ["OLIDS_MASKED", "OLIDS_TERMINOLOGY"]
         
         # Build the SQL query
-        sql_query = self._build_empty_tables_query()
+        sql_query = self._build_empty_tables_query(tuple(self.schemas))
         
         super().__init__(
             name="empty_tables",
@@ -252,88 +510,73 @@ class EmptyTablesTest(StandardSQLTest):
             category="data_quality"
         )
     
-    def _build_empty_tables_query(self) -> str:
-        """Build the SQL query for empty tables detection."""
-        schema_list = "', '".join(self.schemas)
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _build_empty_tables_query(schemas: Tuple[str, ...]) -> str:
+        """Build the SQL query for empty tables detection (cached per schema list)."""
+        schema_list = "', '".join(schemas)
         
-        # This approach is still limited because we can't dynamically generate table checks in pure SQL
-        # In the real implementation, this would need to be done in Python with dynamic SQL generation
-        # For now, let's return a placeholder that indicates the limitation
+        # ROW_COUNT is maintained in the catalog for base tables, so the whole test is a single
+        # metadata query with no per-table scan
         return f"""
         WITH all_tables AS (
             SELECT 
                 table_schema, 
                 table_name,
-                table_schema || '.' || table_name as full_table_name
+                table_schema || '.' || table_name as full_table_name,
+                row_count
             FROM "{{DATABASE}}".INFORMATION_SCHEMA.TABLES 
             WHERE table_schema IN ('{schema_list}')
             AND table_type = 'BASE TABLE'
             AND table_name NOT LIKE '%_BACKUP'
             AND table_name NOT LIKE '%_OLD'
+        ),
+        table_counts AS (
+            SELECT 
+                COUNT(*) as total_tested,
+                COUNT_IF(row_count = 0) as failed_records,
+                LISTAGG(CASE WHEN row_count = 0 THEN '  • ' || full_table_name || ' (0 rows)' END, '\\n')
+                    WITHIN GROUP (ORDER BY full_table_name) as empty_table_lines
+            FROM all_tables
         )
         SELECT 
             'empty_tables' AS test_name,
             'Identifies tables that contain no data (zero rows)' AS test_description,
-            COUNT(*) AS total_tested,
-            0 AS failed_records,  -- Placeholder: requires dynamic SQL generation per table
-            'PASS' AS pass_fail_status,
+            tc.total_tested,
+            tc.failed_records,
+            CASE WHEN tc.failed_records = 0 THEN 'PASS' ELSE 'FAIL' END AS pass_fail_status,
             0.0 AS failure_threshold,
-            0.0 AS actual_failure_rate,
-            'Dynamic table checking requires Python implementation - SQL standardization limited for this test type' AS failure_details,
+            CASE 
+                WHEN tc.total_tested > 0 THEN (tc.failed_records::FLOAT / tc.total_tested::FLOAT * 100.0)
+                ELSE 0.0
+            END AS actual_failure_rate,
+            CASE 
+                WHEN tc.failed_records = 0 THEN 'No empty tables found'
+                ELSE 'Found ' || tc.failed_records || ' empty tables:\\n' || tc.empty_table_lines
+            END AS failure_details,
             CURRENT_TIMESTAMP() AS execution_timestamp
-        FROM all_tables
+        FROM table_counts tc
         """
     
     def execute(self, context: TestContext) -> TestResult:
         """Execute the empty tables test using existing Python logic with consistent output."""
-        # Import and use the original Python logic
-        session = context.session
-        source_db = context.databases["source"]
-        
         try:
-            # Get all tables from specified schemas, excluding backup tables
-            schema_list = "', '".join(self.schemas)
-            tables_query = f"""
-            SELECT table_schema, table_name
-            FROM "{source_db}".INFORMATION_SCHEMA.TABLES 
-            WHERE table_schema IN ('{schema_list}')
-            AND table_type = 'BASE TABLE'
-            AND table_name NOT LIKE '%_BACKUP'
-            AND table_name NOT LIKE '%_OLD'
-            ORDER BY table_schema, table_name
-            """
-            
-            # Log the schema tables query
-            log_sql_query(
-                tables_query,
-                self.name,
-                "get_all_tables",
-                {"database": source_db, "schemas": self.schemas}
-            )
-            
-            tables = session.sql(tables_query).collect()
+            # Get all base tables from specified schemas from the run's shared metadata cache.
+            # ROW_COUNT is maintained in the catalog, so emptiness is read from metadata with
+            # no scan of the tables themselves
+            row_counts = get_metadata_cache(context).get_row_counts(self.schemas)
             
             empty_tables = []
-            total_checked = len(tables)
+            total_checked = 0
             
-            for row in tables:
-                schema_name = row['TABLE_SCHEMA']
-                table_name = row['TABLE_NAME']
-                
-                try:
-                    # Check if table has any rows
-                    count_query = f'SELECT COUNT(*) as row_count FROM "{source_db}"."{schema_name}"."{table_name}"'
-                    
-                    result = session.sql(count_query).collect()[0]
-                    row_count = result['ROW_COUNT']
-                    
-                    # If table has zero rows, it's empty
-                    if row_count == 0:
-                        empty_tables.append(f"{schema_name}.{table_name}")
-                        
-                except Exception:
-                    # Skip tables that can't be queried
+            for (schema_name, table_name), row_count in sorted(row_counts.items()):
+                # Exclude backup tables
+                if table_name.endswith(('_BACKUP', '_OLD')):
                     continue
+                
+                total_checked += 1
+                if row_count == 0:
+                    empty_tables.append(f"{schema_name}.{table_name}")
             
             # Format as standardized output
             failed_records = len(empty_tables)
@@ -352,26 +595,27 @@ class EmptyTablesTest(StandardSQLTest):
                     failure_lines.append(f"  • {table} (0 rows)")
                 failure_details = "\n".join(failure_lines)
             
-            # Log the equivalent query for procedure deployment
-            equivalent_query = f"""
-            -- Output equivalent (would require dynamic SQL generation)
-            SELECT 
-                'empty_tables' AS test_name,
-                'Identifies tables that contain no data (zero rows)' AS test_description,
-                {total_checked} AS total_tested,
-                {failed_records} AS failed_records,
-                '{pass_fail_status}' AS pass_fail_status,
-                0.0 AS failure_threshold,
-                {failure_rate} AS actual_failure_rate,
-                '{failure_details}' AS failure_details,
-                CURRENT_TIMESTAMP() AS execution_timestamp
-            """
-            log_sql_query(
-                equivalent_query,
-                self.name,
-                "output_equivalent",
-                {"empty_tables": empty_tables, "test_type": "python_with_sql_output"}
-            )
+            # Log the equivalent query for procedure deployment, building it only if it will be written
+            if sql_logging_enabled():
+                equivalent_query = f"""
+                -- Output equivalent (would require dynamic SQL generation)
+                SELECT 
+                    'empty_tables' AS test_name,
+                    'Identifies tables that contain no data (zero rows)' AS test_description,
+                    {total_checked} AS total_tested,
+                    {failed_records} AS failed_records,
+                    '{pass_fail_status}' AS pass_fail_status,
+                    0.0 AS failure_threshold,
+                    {failure_rate} AS actual_failure_rate,
+                    '{failure_details}' AS failure_details,
+                    CURRENT_TIMESTAMP() AS execution_timestamp
+                """
+                log_sql_query(
+                    equivalent_query,
+                    self.name,
+                    "output_equivalent",
+                    {"empty_tables": empty_tables, "test_type": "python_with_sql_output"}
+                )
             
             return TestResult(
                 test_name=self.name,
@@ -415,7 +659,7 @@ class ColumnCompletenessTest(StandardSQLTest):
         }
         
         # Build the SQL query (simplified for first column)
-        sql_query = self._build_completeness_query()
+        sql_query = self._build_completeness_query(len(self.completeness_rules))
         
         super().__init__(
             name="column_completeness",
@@ -424,11 +668,17 @@ class ColumnCompletenessTest(StandardSQLTest):
             category="data_quality"
         )
     
-    def _build_completeness_query(self) -> str:
-        """Build the SQL query for column completeness checks."""
-        # Count the number of completeness rules being tested
-        total_rules = len(self.completeness_rules)
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _build_completeness_query(total_rules: int) -> str:
+        """Build the SQL query for column completeness checks (cached per rule count).
         
+        Args:
+            total_rules: Number of completeness rules being tested
+            
+        Returns:
+            Standardized SQL query
+        """
         # Test the failing rule: ENCOUNTER.patient_id (should be 100% complete but isn't)
         # This is known to fail based on previous runs
         table_column = "ENCOUNTER.patient_id"
@@ -482,6 +732,25 @@ class ColumnCompletenessTest(StandardSQLTest):
         FROM failure_analysis fa
         """
     
+    def _get_available_columns(self, context: TestContext) -> Dict[Tuple[str, str], set]:
+        """Get the columns of every schema referenced by the completeness rules.
+        
+        Args:
+            context: Test execution context
+            
+        Returns:
+            Dictionary of (schema, table) -> set of column names; empty if the lookup fails
+        """
+        rule_schemas = {rule['schema'] for rule in self.completeness_rules.values()}
+        if not rule_schemas:
+            return {}
+        
+        try:
+            table_columns = get_metadata_cache(context).get_columns(sorted(rule_schemas))
+            return {table: set(columns) for table, columns in table_columns.items()}
+        except Exception:
+            return {}  # Fall back to letting each completeness query report its own error
+    
     def execute(self, context: TestContext) -> TestResult:
         """Execute the column completeness test using existing Python logic with consistent output."""
         session = context.session
@@ -492,26 +761,89 @@ class ColumnCompletenessTest(StandardSQLTest):
             failed_checks = []
             total_checks = len(self.completeness_rules)
             
+            # Validate every rule's column against one metadata query up front
+            available_columns = self._get_available_columns(context)
+            
+            # Parse each rule and check its column once, then group the found columns by
+            # table so each table is scanned once
+            parsed_rules = []
+            columns_by_table: Dict[Tuple[str, str], List[str]] = {}
+            min_required_by_table: Dict[Tuple[str, str], float] = {}
             for table_column, rule in self.completeness_rules.items():
                 try:
                     table_name, column_name = table_column.split('.')
                     schema_name = rule['schema']
                     min_completeness = rule['min_completeness']
+                except Exception as e:
+                    parsed_rules.append((table_column, e))
+                    continue
+                
+                table_columns = available_columns.get((schema_name, table_name))
+                column_found = not available_columns or (
+                    table_columns is not None and column_name in table_columns
+                )
+                parsed_rules.append(
+                    (table_column, (schema_name, table_name, column_name, min_completeness, column_found))
+                )
+                
+                if column_found:
+                    table_rule_columns = columns_by_table.setdefault((schema_name, table_name), [])
+                    if column_name not in table_rule_columns:
+                        table_rule_columns.append(column_name)
+                    min_required_by_table[(schema_name, table_name)] = min(
+                        min_completeness, min_required_by_table.get((schema_name, table_name), min_completeness)
+                    )
+            
+            metadata_cache = get_metadata_cache(context)
+            
+            def precount_table(table_key: Tuple[str, str]) -> Optional[Tuple[int, Dict[str, Tuple[int, Optional[float]]]]]:
+                schema_name, table_name = table_key
+                columns = columns_by_table[table_key]
+                
+                cached = metadata_cache.get_non_null_counts(schema_name, table_name)
+                if cached is not None and all(column in cached[1] for column in columns):
+                    return cached[0], {column: cached[1][column] for column in columns}
+                
+                # When every rule on the table requires 100%, a NULL probe that stops at the
+                # first NULL settles the passing case; exact counts are only needed on failure
+                if min_required_by_table[table_key] >= 100.0:
+                    counts = _fully_complete_counts(session, source_db, schema_name, table_name, columns)
+                    if counts is not None:
+                        metadata_cache.store_non_null_counts(schema_name, table_name, *counts)
+                    return counts
+                return None
+            
+            table_keys = list(columns_by_table)
+            table_counts = dict(zip(table_keys, _run_concurrently(context, precount_table, table_keys)))
+            
+            # Tables still without counts are counted together in one round-trip. Failed counts
+            # are kept as exceptions and reported against each of the table's rules
+            uncounted_tables = {
+                table_key: columns_by_table[table_key]
+                for table_key, counts in table_counts.items() if not isinstance(counts, tuple)
+            }
+            table_counts.update(_batched_nonnull_counts(context, source_db, uncounted_tables, metadata_cache))
+            
+            for table_column, parsed_rule in parsed_rules:
+                try:
+                    if isinstance(parsed_rule, Exception):
+                        raise parsed_rule
                     
-                    # Calculate completeness rate
-                    completeness_query = f'''
-                    SELECT 
-                        COUNT(*) as total_rows,
-                        COUNT("{column_name}") as non_null_count,
-                        ROUND(COUNT("{column_name}") / COUNT(*) * 100, 2) as completeness_rate
-                    FROM "{source_db}"."{schema_name}"."{table_name}"
-                    '''
+                    schema_name, table_name, column_name, min_completeness, column_found = parsed_rule
+                    if not column_found:
+                        failed_checks.append({
+                            'table_column': table_column,
+                            'error': f"Column not found in {schema_name}.{table_name}"
+                        })
+                        continue
                     
-                    result = session.sql(completeness_query).collect()[0]
+                    counts = table_counts[(schema_name, table_name)]
+                    if isinstance(counts, Exception):
+                        raise counts
                     
-                    total_rows = result['TOTAL_ROWS']
-                    non_null_count = result['NON_NULL_COUNT']
-                    completeness_rate = float(result['COMPLETENESS_RATE'] or 0.0)
+                    total_rows, column_counts = counts
+                    non_null_count, completeness_rate = column_counts[column_name]
+                    completeness_rate = float(completeness_rate or 0.0)
                     
                     completeness_results.append({
                         'table_column': table_column,
@@ -565,26 +897,27 @@ class ColumnCompletenessTest(StandardSQLTest):
                 
                 failure_details = "\n".join(failure_details_list)
             
-            # Log the equivalent query for procedure deployment
-            equivalent_query = f"""
-            -- Output equivalent (would require dynamic SQL generation for all rules)
-            SELECT 
-                'column_completeness' AS test_name,
-                'Checks completeness rates for critical columns' AS test_description,
-                {total_checks} AS total_tested,
-                {failed_records} AS failed_records,
-                '{pass_fail_status}' AS pass_fail_status,
-                0.0 AS failure_threshold,
-                {failure_rate} AS actual_failure_rate,
-                '{failure_details.replace("'", "''")}' AS failure_details,
-                CURRENT_TIMESTAMP() AS execution_timestamp
-            """
-            log_sql_query(
-                equivalent_query,
-                self.name,
-                "output_equivalent",
-                {"failed_checks": failed_checks, "test_type": "python_with_sql_output"}
-            )
+            # Log the equivalent query for procedure deployment, building it only if it will be written
+            if sql_logging_enabled():
+                equivalent_query = f"""
+                -- Output equivalent (would require dynamic SQL generation for all rules)
+                SELECT 
+                    'column_completeness' AS test_name,
+                    'Checks completeness rates for critical columns' AS test_description,
+                    {total_checks} AS total_tested,
+                    {failed_records} AS failed_records,
+                    '{pass_fail_status}' AS pass_fail_status,
+                    0.0 AS failure_threshold,
+                    {failure_rate} AS actual_failure_rate,
+                    '{failure_details.replace("'", "''")}' AS failure_details,
+                    CURRENT_TIMESTAMP() AS execution_timestamp
+                """
+                log_sql_query(
+                    equivalent_query,
+                    self.name,
+                    "output_equivalent",
+                    {"failed_checks": failed_checks, "test_type": "python_with_sql_output"}
+                )
             
             return TestResult(
                 test_name=self.name,
@@ -1,16 +1,34 @@
 """Referential integrity validation tests for OLIDS testing framework."""
 
-import yaml
+import re
+import sys
+import time
+from collections import deque
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
 
-from snowflake.snowpark import Session
+from snowflake.snowpark import AsyncJob, Session
 
 from olids_testing.core.test_base import StandardSQLTest, TestResult, TestStatus, TestContext
 from olids_testing.core.sql_logger import log_sql_query
+from olids_testing.core.metadata_cache import MetadataCache, get_metadata_cache
+from olids_testing.core.test_helpers import PROGRESS_INTERVAL, load_yaml, query_workers, quote_identifier
 
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
+# Asynchronous relationship queries kept in flight at once, so the warehouse is not flooded
+_MAX_IN_FLIGHT = 16
+
+# Reference tables joined to one scan of a source table, keeping batched query plans small
+_MAX_JOINS_PER_SCAN = 8
+
+# Percentage of each source table's micro-partitions read by the fast-mode screen
+_SCREEN_SAMPLE_PERCENT = 1
+
+# Table and column names accepted from the relationship mappings
+_IDENTIFIER = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+# Relationship keys naming the tables and columns a relationship validation query uses
+_IDENTIFIER_KEYS = ('source_table', 'foreign_key', 'reference_table', 'reference_key')
 
 
 class ReferentialIntegrityTest(StandardSQLTest):
@@ -83,17 +101,19 @@ class ReferentialIntegrityTest(StandardSQLTest):
             List of relationship dictionaries
         """
         try:
-            with open(self.mapping_file, 'r') as f:
-                mapping_data = yaml.safe_load(f)
+            mapping_data = load_yaml(self.mapping_file)
             
+            # The parsed mappings are shared, so each relationship is copied before it is annotated
             relationships = []
             for group_name in self.relationship_groups:
                 if group_name in mapping_data:
                     group = mapping_data[group_name]
                     for rel in group.get('relationships', []):
-                        rel['group'] = group_name
-                        rel['group_description'] = group.get('description', '')
-                        relationships.append(rel)
+                        relationships.append({
+                            **rel,
+                            'group': group_name,
+                            'group_description': group.get('description', '')
+                        })
             
             return relationships
             
@@ -113,34 +133,134 @@ class ReferentialIntegrityTest(StandardSQLTest):
         source_db = context.databases["source"]
         schema = context.schemas["masked"]
         
+        # Table references only vary by table name, so the database and schema are quoted once
+        qualified_schema = f"{quote_identifier(source_db)}.{quote_identifier(schema)}"
+        
         try:
             # First, get available columns to validate relationships exist
-            available_columns = self._get_available_columns(session, source_db, schema)
+            available_columns = self._get_available_columns(context, schema)
             
-            validation_results = []
             total_relationships = len(self.relationships)
+            validation_results = [None] * total_relationships
             total_violations = 0
-            skipped_relationships = 0
             
             # Show progress only if not in parallel execution mode
-            import sys
             show_progress = not context.config.get('parallel_execution', False)
             
+            # Partition the relationships up front: those with invalid names or missing columns
+            # are skipped without building or running a query, as are those whose foreign key column another
+            # test in this run has already found to hold no values, since nothing can be orphaned
+            metadata_cache = get_metadata_cache(context)
+            batched_queries = {}
             for i, relationship in enumerate(self.relationships):
+                skipped_result = (
+                    self._invalid_identifiers_result(relationship)
+                    or self._missing_columns_result(relationship, available_columns)
+                )
+                if skipped_result is not None:
+                    validation_results[i] = skipped_result
+                elif self._foreign_key_is_empty(metadata_cache, schema, relationship):
+                    validation_results[i] = self._empty_foreign_key_result(relationship)
+                else:
+                    batched_queries[i] = self._build_validation_query(qualified_schema, relationship)
+            
+            # In fast mode, screen a sample of each source table first and only count relationships
+            # where the sample shows a violation; the rest are reported SCREENED, since orphans
+            # outside the sample are not counted. If the screen fails, every relationship is
+            # counted in full
+            if batched_queries and context.config.get('fast_relationship_screen', False):
+                try:
+                    flagged = self._screen_relationships(batched_queries, session, qualified_schema)
+                except Exception:
+                    flagged = set(batched_queries)
+                for i in list(batched_queries):
+                    if i not in flagged:
+                        validation_results[i] = self._screened_result(self.relationships[i])
+                        del batched_queries[i]
+            
+            # Validate the rest in one round-trip unless disabled (e.g. if the combined query
+            # spills on very large tables); if it fails, each relationship runs on its own below
+            # so the error is reported against the relationship that caused it
+            if batched_queries and context.config.get('batch_relationship_queries', True):
                 if show_progress:
-                    # Show simple progress status with proper overwrite
-                    sys.stdout.write(f"\r  Validating referential integrity relationships [{i+1}/{total_relationships}]")
+                    sys.stdout.write(f"\r  Validating referential integrity relationships [0/{total_relationships}]")
                     sys.stdout.flush()
                 
-                result = self._validate_relationship(
-                    session, source_db, schema, relationship, available_columns
-                )
-                validation_results.append(result)
+                try:
+                    for i, counts in self._run_batched_queries(
+                        batched_queries, session, qualified_schema
+                    ).items():
+                        validation_results[i] = self._validation_result(self.relationships[i], *counts)
+                except Exception:
+                    pass
+            
+            remaining = [i for i, result in enumerate(validation_results) if result is None]
+            completed = total_relationships - len(remaining)
+            last_progress = 0.0
+            
+            # Submit any remaining relationships as asynchronous queries so they run concurrently
+            # in Snowflake, keeping a bounded number in flight and topping up as each is gathered;
+            # a failed query is reported against its relationship
+            max_in_flight = query_workers(context, _MAX_IN_FLIGHT)
+            pending = iter(remaining)
+            async_jobs = deque()
+            
+            def submit_next() -> None:
+                for i in pending:
+                    try:
+                        async_jobs.append((i, self._submit_validation(session, self.relationships[i], batched_queries[i])))
+                        return
+                    except Exception as e:
+                        validation_results[i] = self._error_result(self.relationships[i], e)
+            
+            for _ in range(max_in_flight):
+                submit_next()
+            
+            while async_jobs:
+                i, async_job = async_jobs.popleft()
+                try:
+                    counts, = async_job.result()
+                    validation_results[i] = self._validation_result(self.relationships[i], *counts)
+                except Exception as e:
+                    validation_results[i] = self._error_result(self.relationships[i], e)
+                submit_next()
+                completed += 1
                 
+                # Show simple progress status with proper overwrite, throttled to limit terminal I/O
+                now = time.monotonic()
+                if show_progress and (now - last_progress >= PROGRESS_INTERVAL or completed == total_relationships):
+                    last_progress = now
+                    sys.stdout.write(f"\r  Validating referential integrity relationships [{completed}/{total_relationships}]")
+                    sys.stdout.flush()
+            
+            # Bin the results by status in a single pass. Only the relationship, status and any
+            # reason of VALID results are kept in the metadata; full detail is kept for the rest.
+            # The reason marks VALID results inferred without a full count
+            violated_results = []
+            skipped_results = []
+            screened_results = []
+            reported_results = []
+            for result in validation_results:
                 if result['status'] == 'SKIPPED':
-                    skipped_relationships += 1
+                    skipped_results.append(result)
+                elif result['status'] == 'SCREENED':
+                    screened_results.append(result)
                 elif result['status'] == 'VIOLATED':
+                    violated_results.append(result)
                     total_violations += result['violation_count']
+                elif result['status'] == 'VALID':
+                    compact_result = {
+                        'source_table': result['source_table'],
+                        'foreign_key': result['foreign_key'],
+                        'status': result['status']
+                    }
+                    if 'reason' in result:
+                        compact_result['reason'] = result['reason']
+                    result = compact_result
+                reported_results.append(result)
+            skipped_relationships = len(skipped_results)
+            screened_relationships = len(screened_results)
+            failed_relationships = len(violated_results)
             
             if show_progress:
                 # Clear progress line completely
@@ -148,50 +268,14 @@ class ReferentialIntegrityTest(StandardSQLTest):
                 sys.stdout.write(f"\r{clear_line}\r")  # Clear the entire line
                 sys.stdout.flush()
             
-            # Build failure details - ensure no duplicates
-            failure_details = []
-            if total_violations > 0:
-                failure_details.append(f"Found {total_violations:,} referential integrity violations across {total_relationships} relationships:")
-                
-                # Sort results for consistent output and avoid duplicates
-                violated_results = [r for r in validation_results if r['status'] == 'VIOLATED']
-                
-                # Sort by source table and foreign key for consistent output
-                violated_results.sort(key=lambda x: (x['source_table'], x['foreign_key']))
-                
-                for result in violated_results:
-                    percentage = result.get('violation_percentage', 0.0)
-                    total_with_fk = result.get('total_with_fk', 0)
-                    
-                    # Truncate table names if they're too long, but keep the relationship structure
-                    source_table = result['source_table']
-                    reference_table = result['reference_table']
-                    
-                    # Truncate table names after 25 characters to be more readable
-                    if len(source_table) > 25:
-                        source_table = source_table[:22] + "..."
-                    if len(reference_table) > 25:
-                        reference_table = reference_table[:22] + "..."
-                    
-                    # Create the relationship description with truncated table names
-                    relationship_desc = f"{source_table}.{result['foreign_key']} -> {reference_table}.{result['reference_key']}"
-                    
-                    if total_with_fk > 0:
-                        # Keep the line under 120 characters total
-                        line = f"  • {relationship_desc}: {result['violation_count']:,} invalid ({percentage:.1f}% of {total_with_fk:,})"
-                    else:
-                        line = f"  • {relationship_desc}: {result['violation_count']:,} invalid references"
-                    
-                    failure_details.append(line)
-            
-            if skipped_relationships > 0:
-                failure_details.append(f"\nSkipped {skipped_relationships} relationships due to missing columns:")
-                for result in validation_results:
-                    if result['status'] == 'SKIPPED':
-                        failure_details.append(f"  • {result['source_table']}.{result['foreign_key']}: {result['reason']}")
+            # Build failure details lazily; the first line doubles as the summary in the logged query
+            detail_lines = self._failure_detail_lines(
+                violated_results, skipped_results, screened_relationships, total_violations, total_relationships
+            )
+            failure_summary = next(detail_lines, None)
+            failure_details = "\n".join(chain([failure_summary], detail_lines)) if failure_summary is not None else None
             
             # Format as consistent output
-            failed_relationships = len([r for r in validation_results if r['status'] == 'VIOLATED'])
             failure_rate = (failed_relationships / total_relationships * 100) if total_relationships > 0 else 0.0
             
             # Determine test status
@@ -201,6 +285,9 @@ class ReferentialIntegrityTest(StandardSQLTest):
             elif skipped_relationships == total_relationships:
                 status = TestStatus.ERROR  # All relationships were skipped
                 pass_fail_status = "ERROR"
+            elif skipped_relationships + screened_relationships == total_relationships:
+                status = TestStatus.SKIPPED  # Only samples were checked, so nothing was fully counted
+                pass_fail_status = "SKIPPED"
             else:
                 status = TestStatus.PASSED
                 pass_fail_status = "PASS"
@@ -217,9 +304,9 @@ class ReferentialIntegrityTest(StandardSQLTest):
                     '{pass_fail_status}' AS pass_fail_status,
                     0.0 AS failure_threshold,
                     {failure_rate} AS actual_failure_rate,
-                    '{failure_details[0].replace("'", "''")}' AS failure_details,
+                    '{failure_summary.replace("'", "''")}' AS failure_details,
                     CURRENT_TIMESTAMP() AS execution_timestamp
-                """ if failure_details else f"""
+                """ if failure_summary is not None else f"""
                 -- Output equivalent
                 SELECT 
                     'referential_integrity' AS test_name,
@@ -246,14 +333,15 @@ class ReferentialIntegrityTest(StandardSQLTest):
                 total_tested=total_relationships,
                 failed_records=failed_relationships,
                 failure_rate=failure_rate,
-                failure_details="\n".join(failure_details) if failure_details else None,
+                failure_details=failure_details,
                 metadata={
                     'failure_threshold_used': 0.0,
                     'relationship_groups': self.relationship_groups,
                     'total_relationships': total_relationships,
                     'total_violations': total_violations,
                     'skipped_relationships': skipped_relationships,
-                    'validation_results': validation_results
+                    'screened_relationships': screened_relationships,
+                    'validation_results': reported_results
                 }
             )
             
@@ -266,136 +354,462 @@ class ReferentialIntegrityTest(StandardSQLTest):
                 metadata={'relationship_groups': self.relationship_groups}
             )
     
-    def _get_available_columns(self, session: Session, database: str, schema: str) -> set:
-        """Get set of available (table, column) pairs.
+    def _failure_detail_lines(self, violated_results: List[Dict], skipped_results: List[Dict],
+                              screened_relationships: int, total_violations: int,
+                              total_relationships: int) -> Iterator[str]:
+        """Generate the failure detail lines for violated, skipped and screened relationships.
         
         Args:
-            session: Snowflake session
-            database: Database name
+            violated_results: Results of relationships with violations
+            skipped_results: Results of skipped relationships
+            screened_relationships: Number of relationships only checked in a sample
+            total_violations: Violations across all relationships
+            total_relationships: Number of relationships tested
+            
+        Yields:
+            Failure detail lines, in reporting order
+        """
+        if total_violations > 0:
+            yield f"Found {total_violations:,} referential integrity violations across {total_relationships} relationships:"
+            
+            # Sort by source table and foreign key for consistent output
+            violated_results = sorted(violated_results, key=lambda x: (x['source_table'], x['foreign_key']))
+            
+            # Truncate table names after 25 characters to be more readable, abbreviating each
+            # distinct name once since the same tables recur across relationships
+            short_names = {
+                table: table[:22] + "..." if len(table) > 25 else table
+                for result in violated_results
+                for table in (result['source_table'], result['reference_table'])
+            }
+            
+            for result in violated_results:
+                percentage = result.get('violation_percentage', 0.0)
+                total_with_fk = result.get('total_with_fk', 0)
+                
+                # Truncate table names if they're too long, but keep the relationship structure
+                source_table = short_names[result['source_table']]
+                reference_table = short_names[result['reference_table']]
+                
+                # Create the relationship description with truncated table names
+                relationship_desc = f"{source_table}.{result['foreign_key']} -> {reference_table}.{result['reference_key']}"
+                
+                if total_with_fk > 0:
+                    # Keep the line under 120 characters total
+                    yield f"  • {relationship_desc}: {result['violation_count']:,} invalid ({percentage:.1f}% of {total_with_fk:,})"
+                else:
+                    yield f"  • {relationship_desc}: {result['violation_count']:,} invalid references"
+        
+        if skipped_results:
+            yield f"\nSkipped {len(skipped_results)} relationships:"
+            for result in skipped_results:
+                yield f"  • {result['source_table']}.{result['foreign_key']}: {result['reason']}"
+        
+        if screened_relationships:
+            yield (
+                f"\nScreened {screened_relationships} relationships with a {_SCREEN_SAMPLE_PERCENT}% sample only; "
+                "orphans outside the sample were not counted"
+            )
+    
+    def _get_available_columns(self, context: TestContext, schema: str) -> Dict[str, FrozenSet[str]]:
+        """Get the available columns of each table referenced by the relationships.
+        
+        The column listing comes from the run's shared metadata cache, so tests checking the
+        same schema reuse one INFORMATION_SCHEMA lookup. Column sets are only built for the
+        tables the relationships use; other tables in the schema are left out.
+        
+        Args:
+            context: Test execution context
             schema: Schema name
             
         Returns:
-            Set of (table_name, column_name) tuples
+            Dictionary of table name -> frozenset of column names
         """
-        columns_query = f"""
-        SELECT table_name, column_name
-        FROM "{database}".INFORMATION_SCHEMA.COLUMNS 
-        WHERE table_schema = '{schema}'
+        referenced_tables = {
+            table
+            for relationship in self.relationships
+            for table in (relationship.get('source_table'), relationship.get('reference_table'))
+        }
+        table_columns = get_metadata_cache(context).get_columns([schema])
+        return {
+            table_name: frozenset(columns)
+            for (_, table_name), columns in table_columns.items()
+            if table_name in referenced_tables
+        }
+    
+    def _run_batched_queries(self, queries: Dict[int, str], session: Session,
+                             qualified_schema: str) -> Dict[int, Tuple]:
+        """Validate several relationships in one round-trip, scanning each source table once.
+        
+        Relationships are grouped by source table, in groups of at most _MAX_JOINS_PER_SCAN. Each
+        group becomes a CTE that LEFT JOINs every referenced table to a single scan of the source
+        table and aggregates all of the group's counts, and one UNION ALL reads each
+        relationship's counts back out as a row.
+        
+        Args:
+            queries: Relationship index -> validation query; only the indices are used
+            session: Snowflake session
+            qualified_schema: Quoted, fully qualified schema name
+            
+        Returns:
+            Dictionary of relationship index -> (violation_count, total_with_fk, first_violation,
+            last_violation)
         """
+        indices_by_source: Dict[str, List[int]] = {}
+        for index in queries:
+            indices_by_source.setdefault(self.relationships[index]['source_table'], []).append(index)
+        
+        # Split tables with many foreign keys so no single scan fans out into too many joins
+        groups = [
+            (source_table, indices[start:start + _MAX_JOINS_PER_SCAN])
+            for source_table, indices in indices_by_source.items()
+            for start in range(0, len(indices), _MAX_JOINS_PER_SCAN)
+        ]
+        
+        group_ctes = []
+        count_rows = []
+        for group_number, (source_table, indices) in enumerate(groups):
+            group_name = f"source_{group_number}"
+            aggregates = []
+            joins = []
+            for index in indices:
+                relationship = self.relationships[index]
+                foreign_key = quote_identifier(relationship['foreign_key'])
+                reference_key = quote_identifier(relationship['reference_key'])
+                
+                # Reference keys are de-duplicated so no join can repeat source rows
+                ref = f"ref_{index}"
+                violation = f'src.{foreign_key} IS NOT NULL AND {ref}.{reference_key} IS NULL'
+                joins.append(f"""
+                LEFT JOIN (
+                    SELECT DISTINCT {reference_key} FROM {qualified_schema}.{quote_identifier(relationship['reference_table'])}
+                ) {ref} 
+                    ON src.{foreign_key} = {ref}.{reference_key}""")
+                aggregates.append(f"""
+                    COUNT_IF({violation}) as violation_count_{index},
+                    COUNT_IF(src.{foreign_key} IS NOT NULL) as total_with_fk_{index},
+                    TO_VARCHAR(MIN(CASE WHEN {violation} THEN src.{foreign_key} END)) as first_violation_{index},
+                    TO_VARCHAR(MAX(CASE WHEN {violation} THEN src.{foreign_key} END)) as last_violation_{index}""")
+                count_rows.append(f"""
+            SELECT {index} AS relationship_index, violation_count_{index}, total_with_fk_{index},
+                first_violation_{index}, last_violation_{index}
+            FROM {group_name}""")
+            
+            group_ctes.append(f"""{group_name} AS (
+                SELECT {",".join(aggregates)}
+                FROM {qualified_schema}.{quote_identifier(source_table)} src{"".join(joins)}
+            )""")
+        
+        batched_query = f"""
+            WITH {", ".join(group_ctes)}""" + "\n            UNION ALL".join(count_rows)
         
-        # Log the query
         log_sql_query(
-            columns_query,
-            self.name,
-            "get_available_columns",
-            {"database": database, "schema": schema}
+            batched_query,
+            "referential_integrity",
+            "batched_relationship_validation",
+            {"relationships": len(queries), "source_tables": len(indices_by_source), "source_scans": len(groups)}
         )
         
-        columns = session.sql(columns_query).collect()
-        return {(row['TABLE_NAME'], row['COLUMN_NAME']) for row in columns}
+        return {
+            relationship_index: tuple(counts)
+            for relationship_index, *counts in session.sql(batched_query).collect()
+        }
     
-    def _validate_relationship(self, session: Session, database: str, schema: str, 
-                             relationship: Dict, available_columns: set) -> Dict:
-        """Validate a single foreign key relationship.
+    def _screen_relationships(self, queries: Dict[int, str], session: Session,
+                              qualified_schema: str) -> set:
+        """Find relationships with a violation in a sample of their source table, in one round-trip.
+        
+        Each check stops at the first violating row found in the sample.
         
         Args:
+            queries: Relationship index -> validation query; only the indices are used
             session: Snowflake session
-            database: Database name 
+            qualified_schema: Quoted, fully qualified schema name
+            
+        Returns:
+            Set of relationship indices with at least one sampled violation
+        """
+        screen_queries = []
+        for index in queries:
+            relationship = self.relationships[index]
+            source_table = quote_identifier(relationship['source_table'])
+            foreign_key = quote_identifier(relationship['foreign_key'])
+            reference_table = quote_identifier(relationship['reference_table'])
+            reference_key = quote_identifier(relationship['reference_key'])
+            screen_queries.append(f"""
+            SELECT {index} AS relationship_index FROM (
+                SELECT 1
+                FROM {qualified_schema}.{source_table} SAMPLE SYSTEM ({_SCREEN_SAMPLE_PERCENT}) src
+                LEFT JOIN {qualified_schema}.{reference_table} ref 
+                    ON src.{foreign_key} = ref.{reference_key}
+                WHERE src.{foreign_key} IS NOT NULL 
+                    AND ref.{reference_key} IS NULL
+                LIMIT 1
+            )""")
+        screen_query = "\n            UNION ALL\n".join(screen_queries)
+        
+        log_sql_query(
+            screen_query,
+            "referential_integrity",
+            "screen_relationship_samples",
+            {"relationships": len(queries), "sample_percent": _SCREEN_SAMPLE_PERCENT}
+        )
+        
+        return {relationship_index for relationship_index, in session.sql(screen_query).collect()}
+    
+    def _screened_result(self, relationship: Dict) -> Dict:
+        """Build the SCREENED result of a relationship whose sampled screen found no violation.
+        
+        Args:
+            relationship: Relationship configuration dictionary
+            
+        Returns:
+            Dictionary with validation result
+        """
+        return {
+            'source_table': relationship['source_table'],
+            'foreign_key': relationship['foreign_key'],
+            'reference_table': relationship['reference_table'],
+            'reference_key': relationship['reference_key'],
+            'description': relationship.get('description', ''),
+            'status': 'SCREENED',
+            'reason': f"No violation in a {_SCREEN_SAMPLE_PERCENT}% sample of {relationship['source_table']}",
+            'violation_count': 0,
+            'total_with_fk': 0,
+            'violation_percentage': 0.0
+        }
+    
+    def _foreign_key_is_empty(self, metadata_cache: MetadataCache, schema: str, relationship: Dict) -> bool:
+        """Check whether a relationship's foreign key column is known to hold no values.
+        
+        Only non-null counts already collected in this run (e.g. by the completeness checks)
+        are consulted; no query is run.
+        
+        Args:
+            metadata_cache: Run-wide metadata cache
             schema: Schema name
             relationship: Relationship configuration dictionary
-            available_columns: Set of available (table, column) pairs
+            
+        Returns:
+            True if the foreign key column has been counted and has no non-null values
+        """
+        cached = metadata_cache.get_non_null_counts(schema, relationship['source_table'])
+        if cached is None:
+            return False
+        
+        _, column_counts = cached
+        counts = column_counts.get(relationship['foreign_key'])
+        return counts is not None and counts[0] == 0
+    
+    def _empty_foreign_key_result(self, relationship: Dict) -> Dict:
+        """Build the VALID result of a relationship whose foreign key column holds no values.
+        
+        Args:
+            relationship: Relationship configuration dictionary
             
         Returns:
             Dictionary with validation result
         """
+        return {
+            'source_table': relationship['source_table'],
+            'foreign_key': relationship['foreign_key'],
+            'reference_table': relationship['reference_table'],
+            'reference_key': relationship['reference_key'],
+            'description': relationship.get('description', ''),
+            'status': 'VALID',
+            'reason': f"No non-null {relationship['source_table']}.{relationship['foreign_key']} values",
+            'violation_count': 0,
+            'total_with_fk': 0,
+            'violation_percentage': 0.0
+        }
+    
+    def _invalid_identifiers_result(self, relationship: Dict) -> Optional[Dict]:
+        """Get the SKIPPED result for a relationship whose table or column names are not plain identifiers.
+        
+        Args:
+            relationship: Relationship configuration dictionary
+            
+        Returns:
+            Dictionary with the SKIPPED validation result, or None if every name is valid
+        """
+        invalid = [
+            f"{key}={relationship.get(key)!r}"
+            for key in _IDENTIFIER_KEYS
+            if not isinstance(relationship.get(key), str) or not _IDENTIFIER.fullmatch(relationship[key])
+        ]
+        if not invalid:
+            return None
+        
+        return {
+            'source_table': relationship.get('source_table'),
+            'foreign_key': relationship.get('foreign_key'),
+            'reference_table': relationship.get('reference_table'),
+            'reference_key': relationship.get('reference_key'),
+            'description': relationship.get('description', ''),
+            'status': 'SKIPPED',
+            'reason': f"Invalid identifiers: {', '.join(invalid)}",
+            'violation_count': 0
+        }
+    
+    def _missing_columns_result(self, relationship: Dict,
+                                available_columns: Dict[str, FrozenSet[str]]) -> Optional[Dict]:
+        """Get the SKIPPED result for a relationship whose columns do not exist.
+        
+        Args:
+            relationship: Relationship configuration dictionary
+            available_columns: Table name -> available column names
+            
+        Returns:
+            Dictionary with the SKIPPED validation result, or None if both columns exist
+        """
         source_table = relationship['source_table']
         foreign_key = relationship['foreign_key']
         reference_table = relationship['reference_table']
         reference_key = relationship['reference_key']
-        description = relationship.get('description', '')
         
         # Check if both columns exist
-        source_exists = (source_table, foreign_key) in available_columns
-        ref_exists = (reference_table, reference_key) in available_columns
-        
-        if not source_exists or not ref_exists:
-            missing = []
-            if not source_exists:
-                missing.append(f"{source_table}.{foreign_key}")
-            if not ref_exists:
-                missing.append(f"{reference_table}.{reference_key}")
-            
-            return {
-                'source_table': source_table,
-                'foreign_key': foreign_key,
-                'reference_table': reference_table,
-                'reference_key': reference_key,
-                'description': description,
-                'status': 'SKIPPED',
-                'reason': f"Missing columns: {', '.join(missing)}",
-                'violation_count': 0
-            }
+        source_exists = foreign_key in available_columns.get(source_table, ())
+        ref_exists = reference_key in available_columns.get(reference_table, ())
         
-        try:
-            # Find records with foreign keys that don't exist in the referenced table
-            # Using LEFT JOIN (same as legacy script) with query optimization
-            # Also get total row count for percentage calculation
-            validation_query = f"""
+        if source_exists and ref_exists:
+            return None
+        
+        missing = []
+        if not source_exists:
+            missing.append(f"{source_table}.{foreign_key}")
+        if not ref_exists:
+            missing.append(f"{reference_table}.{reference_key}")
+        
+        return {
+            'source_table': source_table,
+            'foreign_key': foreign_key,
+            'reference_table': reference_table,
+            'reference_key': reference_key,
+            'description': relationship.get('description', ''),
+            'status': 'SKIPPED',
+            'reason': f"Missing columns: {', '.join(missing)}",
+            'violation_count': 0
+        }
+    
+    def _build_validation_query(self, qualified_schema: str, relationship: Dict) -> str:
+        """Build the query counting a relationship's orphaned foreign keys.
+        
+        Args:
+            qualified_schema: Quoted, fully qualified schema name
+            relationship: Relationship configuration dictionary
+            
+        Returns:
+            Query returning VIOLATION_COUNT, TOTAL_WITH_FK and the lowest and highest violating
+            foreign keys as text (FIRST_VIOLATION, LAST_VIOLATION)
+        """
+        source_table = quote_identifier(relationship['source_table'])
+        foreign_key = quote_identifier(relationship['foreign_key'])
+        reference_table = quote_identifier(relationship['reference_table'])
+        reference_key = quote_identifier(relationship['reference_key'])
+        
+        # Find records with foreign keys that don't exist in the referenced table, and the total
+        # with a foreign key for the percentage, in one pass over the source table. Reference
+        # keys are de-duplicated so the join cannot repeat source rows in the total. Example
+        # violating keys come from MIN/MAX rather than ARRAY_AGG, which could exceed the array
+        # size limit on badly broken tables; they are cast to text so batched queries union
+        violation = f'src.{foreign_key} IS NOT NULL AND ref.{reference_key} IS NULL'
+        return f"""
             SELECT 
-                COUNT(*) as violation_count,
-                (SELECT COUNT(*) FROM "{database}"."{schema}"."{source_table}" WHERE "{foreign_key}" IS NOT NULL) as total_with_fk
-            FROM "{database}"."{schema}"."{source_table}" src
-            LEFT JOIN "{database}"."{schema}"."{reference_table}" ref 
-                ON src."{foreign_key}" = ref."{reference_key}"
-            WHERE src."{foreign_key}" IS NOT NULL 
-                AND ref."{reference_key}" IS NULL
+                COUNT_IF({violation}) as violation_count,
+                COUNT_IF(src.{foreign_key} IS NOT NULL) as total_with_fk,
+                TO_VARCHAR(MIN(CASE WHEN {violation} THEN src.{foreign_key} END)) as first_violation,
+                TO_VARCHAR(MAX(CASE WHEN {violation} THEN src.{foreign_key} END)) as last_violation
+            FROM {qualified_schema}.{source_table} src
+            LEFT JOIN (
+                SELECT DISTINCT {reference_key} FROM {qualified_schema}.{reference_table}
+            ) ref 
+                ON src.{foreign_key} = ref.{reference_key}
             """
+    
+    def _validation_result(self, relationship: Dict, violation_count: int, total_with_fk: int,
+                           first_violation: Optional[str] = None,
+                           last_violation: Optional[str] = None) -> Dict:
+        """Build the validation result of a relationship from its counts.
+        
+        Args:
+            relationship: Relationship configuration dictionary
+            violation_count: Number of foreign keys with no referenced record
+            total_with_fk: Number of records with a non-null foreign key
+            first_violation: Lowest violating foreign key, if any
+            last_violation: Highest violating foreign key, if any
             
-            # Log the validation query
-            log_sql_query(
-                validation_query,
-                "referential_integrity",
-                f"{source_table}_{foreign_key}_to_{reference_table}_{reference_key}",
-                {
-                    "source_table": source_table,
-                    "foreign_key": foreign_key,
-                    "reference_table": reference_table,
-                    "reference_key": reference_key,
-                    "description": description
-                }
-            )
+        Returns:
+            Dictionary with validation result
+        """
+        # Calculate violation percentage
+        violation_percentage = (violation_count / total_with_fk * 100) if total_with_fk > 0 else 0.0
+        
+        return {
+            'source_table': relationship['source_table'],
+            'foreign_key': relationship['foreign_key'],
+            'reference_table': relationship['reference_table'],
+            'reference_key': relationship['reference_key'],
+            'description': relationship.get('description', ''),
+            'status': 'VIOLATED' if violation_count > 0 else 'VALID',
+            'violation_count': violation_count,
+            'total_with_fk': total_with_fk,
+            'violation_percentage': violation_percentage,
+            'sample_violations': list(dict.fromkeys(
+                key for key in (first_violation, last_violation) if key is not None
+            ))
+        }
+    
+    def _submit_validation(self, session: Session, relationship: Dict, validation_query: str) -> AsyncJob:
+        """Submit a relationship's validation query without waiting for it to finish.
+        
+        Args:
+            session: Snowflake session
+            relationship: Relationship configuration dictionary
+            validation_query: Relationship validation query
             
-            result = session.sql(validation_query).collect()[0]
-            violation_count = result['VIOLATION_COUNT']
-            total_with_fk = result['TOTAL_WITH_FK']
-            
-            # Calculate violation percentage
-            violation_percentage = (violation_count / total_with_fk * 100) if total_with_fk > 0 else 0.0
-            
-            return {
-                'source_table': source_table,
-                'foreign_key': foreign_key,
-                'reference_table': reference_table,
-                'reference_key': reference_key,
-                'description': description,
-                'status': 'VIOLATED' if violation_count > 0 else 'VALID',
-                'violation_count': violation_count,
-                'total_with_fk': total_with_fk,
-                'violation_percentage': violation_percentage,
-                'query_executed': validation_query.replace('\n', ' ').strip()
+        Returns:
+            Asynchronous job for the running query
+        """
+        source_table = relationship['source_table']
+        foreign_key = relationship['foreign_key']
+        reference_table = relationship['reference_table']
+        reference_key = relationship['reference_key']
+        
+        # Log the validation query
+        log_sql_query(
+            validation_query,
+            "referential_integrity",
+            f"{source_table}_{foreign_key}_to_{reference_table}_{reference_key}",
+            {
+                "source_table": source_table,
+                "foreign_key": foreign_key,
+                "reference_table": reference_table,
+                "reference_key": reference_key,
+                "description": relationship.get('description', '')
             }
+        )
+        
+        return session.sql(validation_query).collect_nowait()
+    
+    def _error_result(self, relationship: Dict, error: Exception) -> Dict:
+        """Build the validation result of a relationship whose query failed.
+        
+        Args:
+            relationship: Relationship configuration dictionary
+            error: Exception raised while running the validation query
             
-        except Exception as e:
-            return {
-                'source_table': source_table,
-                'foreign_key': foreign_key,
-                'reference_table': reference_table,
-                'reference_key': reference_key,
-                'description': description,
-                'status': 'ERROR',
-                'reason': f"Query execution failed: {str(e)}",
-                'violation_count': 0,
-                'total_with_fk': 0,
-                'violation_percentage': 0.0
-            }
-
+        Returns:
+            Dictionary with validation result
+        """
+        return {
+            'source_table': relationship['source_table'],
+            'foreign_key': relationship['foreign_key'],
+            'reference_table': relationship['reference_table'],
+            'reference_key': relationship['reference_key'],
+            'description': relationship.get('description', ''),
+            'status': 'ERROR',
+            'reason': f"Query execution failed: {str(error)}",
+            'violation_count': 0,
+            'total_with_fk': 0,
+            'violation_percentage': 0.0
+        }